@@ -6,30 +6,77 @@
 from src.tf_cpu_init import configure_tensorflow_cpu
 
 import os
+import threading
+import orjson
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from werkzeug.exceptions import HTTPException
 from src.image_finder import LicensedImageFinder
 from src.config import Config
 
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for faster (de)serialization."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping a str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+            mimetype='application/json'
+        )
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+# Search requests are tiny; reject oversized bodies before parsing them
+app.config['MAX_CONTENT_LENGTH'] = 64 * 1024
 CORS(app)  # Enable CORS for all routes
 
-# Lazy initialization to avoid hanging during startup
+# Built on first use, or ahead of time by start_warmup()
 finder = None
+_finder_lock = threading.Lock()
 
 def get_finder():
     """Get or create the LicensedImageFinder instance."""
     global finder
     if finder is None:
-        print("Initializing LicensedImageFinder...")
-        finder = LicensedImageFinder()
-        print("✓ LicensedImageFinder initialized")
+        with _finder_lock:
+            if finder is None:
+                print("Initializing LicensedImageFinder...")
+                finder = LicensedImageFinder()
+                print("✓ LicensedImageFinder initialized")
     return finder
 
 
+def start_warmup() -> threading.Thread:
+    """Build the finder in a background thread so the first request doesn't pay for model loading.
+
+    Called when the server starts (``__main__`` or gunicorn's post_fork hook),
+    never at import time, so importing this module does not open the cache.
+    """
+    thread = threading.Thread(target=get_finder, name='finder-warmup', daemon=True)
+    thread.start()
+    return thread
+
+
 @app.route('/health', methods=['GET'])
 def health():
-    """Health check endpoint."""
+    """Health check endpoint. Reports 503 until the finder has finished warming up."""
+    if finder is None:
+        return jsonify({
+            'status': 'starting',
+            'service': 'OpenImage API',
+            'version': '0.1.0'
+        }), 503
+
     return jsonify({
         'status': 'healthy',
         'service': 'OpenImage API',
@@ -106,7 +153,12 @@ def search():
                 'error': 'Content-Type must be application/json'
             }), 400
 
-        data = request.get_json()
+        data = request.get_json(silent=True, cache=True)
+        if not isinstance(data, dict):
+            return jsonify({
+                'success': False,
+                'error': 'Request body must be a JSON object'
+            }), 400
 
         # Extract parameters
         query = data.get('query')
@@ -117,9 +169,16 @@ def search():
             }), 400
 
         entity_type = data.get('entity_type', 'person')
-        max_results = int(data.get('max_results', 20))
         require_face = data.get('require_face', True)
 
+        try:
+            max_results = int(data.get('max_results', 20))
+        except (TypeError, ValueError):
+            return jsonify({
+                'success': False,
+                'error': 'max_results must be an integer'
+            }), 400
+
         # Validate entity_type
         valid_types = ['person', 'place', 'thing', 'other']
         if entity_type not in valid_types:
@@ -155,6 +214,9 @@ def search():
             }
         }), 200
 
+    except HTTPException:
+        # Let Flask's error handlers answer (e.g. 413 for oversized bodies)
+        raise
     except Exception as e:
         return jsonify({
             'success': False,
@@ -171,6 +233,15 @@ def not_found(error):
     }), 404
 
 
+@app.errorhandler(413)
+def request_too_large(error):
+    """Handle oversized request bodies."""
+    return jsonify({
+        'success': False,
+        'error': 'Request body too large'
+    }), 413
+
+
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors."""
@@ -202,7 +273,11 @@ if __name__ == '__main__':
     print("  GET  /api/sources      - Get available sources")
     print("  POST /api/search       - Search for images")
 
+    print("\nThis is Flask's development server; for production use:")
+    print("  gunicorn -c gunicorn.conf.py api_server:app")
+
     print("\nPress Ctrl+C to stop the server")
     print("=" * 60)
 
-    app.run(host=host, port=port, debug=debug)
+    start_warmup()
+    app.run(host=host, port=port, debug=debug, threaded=True)
@@ -51,7 +51,7 @@ def main():
         if stats['popular_queries']:
             print("\n🔥 Most Popular Queries:")
             print("-" * 50)
-            for i, query_info in enumerate(stats['popular_queries'][:10], 1):
+            for i, query_info in enumerate(stats['popular_queries'], 1):
                 print(f"{i}. {query_info['query']} ({query_info['entity_type']}) "
                       f"- {query_info['source']}: {query_info['hits']} hits")
 
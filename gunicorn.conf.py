@@ -0,0 +1,28 @@
+"""Gunicorn configuration for the OpenImage API server.
+
+Usage:
+    gunicorn -c gunicorn.conf.py api_server:app
+"""
+
+import os
+
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', 8000)}"
+
+# Each worker loads its own face/gender models, so keep the process count
+# modest and use threads for concurrency: searches mostly wait on the network.
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+
+# Searches with face detection and gender filtering can take a while
+timeout = 120
+
+# Not preloading: TensorFlow is not fork-safe, so each worker builds its
+# own finder after the fork.
+preload_app = False
+
+
+def post_fork(server, worker):
+    """Start warming the finder in the new worker so /health turns ready without a request."""
+    import api_server
+    api_server.start_warmup()
@@ -2,12 +2,28 @@
 """Main entry point for the Licensed Image Finder."""
 
 import sys
-import json
 import argparse
+import orjson
 from src.image_finder import LicensedImageFinder
 from src.config import Config
 
 
+def _write_json(data, stream):
+    """Write data as indented JSON to a binary stream.
+
+    orjson serializes straight to UTF-8 bytes, avoiding the intermediate
+    str (and its encode step) that json.dumps would build.
+
+    Args:
+        data: JSON-serializable data
+        stream: Binary file object, e.g. an open file or sys.stdout.buffer
+    """
+    sys.stdout.flush()
+    stream.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    stream.write(b"\n")
+    stream.flush()
+
+
 def main():
     """Main function to run the image finder from command line."""
     parser = argparse.ArgumentParser(
@@ -55,7 +71,7 @@ def main():
     # Show status if requested
     if args.status:
         status = finder.get_status()
-        print(json.dumps(status, indent=2))
+        _write_json(status, sys.stdout.buffer)
         return 0
 
     # Search for images
@@ -70,6 +86,7 @@ def main():
         max_results=args.max_results,
         require_face=require_face
     )
+    finder.close()
 
     # Prepare output
     output_data = {
@@ -81,14 +98,12 @@ def main():
     }
 
     # Write output
-    output_json = json.dumps(output_data, indent=2)
-
     if args.output:
-        with open(args.output, 'w') as f:
-            f.write(output_json)
+        with open(args.output, 'wb') as f:
+            _write_json(output_data, f)
         print(f"\nResults saved to {args.output}", file=sys.stderr)
     else:
-        print(output_json)
+        _write_json(output_data, sys.stdout.buffer)
 
     print(f"\nFound {len(results)} high-quality, license-safe images", file=sys.stderr)
 
@@ -1,17 +1,150 @@
 """SQLite-based caching system for API responses."""
 
-import sqlite3
-import json
+import atexit
 import hashlib
+import sqlite3
+import queue
+import threading
 import time
-from typing import Optional, List, Dict, Any
+import unicodedata
+import weakref
+import zlib
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from pathlib import Path
 from datetime import datetime, timedelta
+import orjson
+
+
+def _encode_results(results: List[Dict[str, Any]]) -> bytes:
+    """Serialize and compress search results for storage."""
+    return zlib.compress(orjson.dumps(results))
+
+
+def _url_hash(image_url: str) -> bytes:
+    """Hash an image URL into the fixed-size key used by the face/gender caches."""
+    return hashlib.blake2b(image_url.encode(), digest_size=16).digest()
+
+
+def _decode_results(data: bytes) -> List[Dict[str, Any]]:
+    """Decompress and deserialize stored search results."""
+    return orjson.loads(zlib.decompress(data))
+
+
+# Open caches whose buffered hit counts are written at interpreter exit; held
+# weakly so that registering for exit does not keep a cache alive
+_open_caches: "weakref.WeakSet[ImageCache]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_caches():
+    """Write buffered hit counts of every cache still open at interpreter exit."""
+    for cache in list(_open_caches):
+        try:
+            cache._flush_hits()
+        except Exception as e:
+            print(f"⚠ Could not flush cache hit counts for {cache.db_path}: {e}")
+
+
+def _release_pool(stop_event: threading.Event, pool: "queue.Queue[sqlite3.Connection]", pool_size: int):
+    """Stop a cache's maintenance threads and close its pooled connections.
+
+    Holds no reference to the cache itself, so it can run as the cache's finalizer.
+    """
+    stop_event.set()
+    for i in range(pool_size):
+        conn = pool.get()
+        if i == 0:
+            # Recommended before closing: refresh statistics that have drifted
+            conn.execute('PRAGMA optimize')
+        conn.close()
+
+
+class MemoryCache:
+    """Small thread-safe LRU mapping whose entries expire after a TTL."""
+
+    def __init__(self, maxsize: int, ttl: int):
+        """Initialize the in-memory cache.
+
+        Args:
+            maxsize: Maximum number of entries kept before evicting the least recently used
+            ttl: Time-to-live for entries in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value stored for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, expires_at: Optional[float] = None):
+        """Store a value, expiring after the TTL or at expires_at if that is sooner."""
+        expiry = time.time() + self.ttl
+        if expires_at is not None:
+            expiry = min(expiry, expires_at)
+
+        with self._lock:
+            self._entries[key] = (expiry, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: str):
+        """Remove key if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
 
 
 class ImageCache:
     """Cache for image search results using SQLite."""
 
+    # Number of persistent connections shared by request threads
+    POOL_SIZE = 8
+
+    # In-process cache of hot entries in front of SQLite
+    MEMORY_CACHE_SIZE = 1024
+    FACE_MEMORY_CACHE_SIZE = 4096
+    GENDER_MEMORY_CACHE_SIZE = 4096
+    MEMORY_CACHE_TTL = 300  # seconds
+
+    # How often buffered hit counts are written to the database
+    HIT_FLUSH_INTERVAL = 30  # seconds
+    # ...or sooner, once this many distinct entries have pending hits
+    HIT_FLUSH_THRESHOLD = 1000
+
+    # How often expired rows are swept, so each sweep only deletes a small batch
+    EXPIRY_SWEEP_INTERVAL = 3600  # seconds
+
+    # How often free pages are reclaimed and planner statistics refreshed
+    MAINTENANCE_INTERVAL = 6 * 3600  # seconds
+    # Sweeps deleting more rows than this reclaim the freed pages right away
+    VACUUM_AFTER_DELETES = 1000
+
+    # Maximum number of URLs bound into a single IN (...) lookup
+    BULK_LOOKUP_CHUNK = 500
+
+    # Bumped whenever existing databases need migrating (stored in PRAGMA user_version)
+    SCHEMA_VERSION = 5
+
     def __init__(self, db_path: str = "data/image_cache.db", ttl_days: int = 30):
         """Initialize the cache.
 
@@ -25,14 +158,191 @@ class ImageCache:
         # Create data directory if it doesn't exist
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
+        # Deserialized results, face detections and genders for recently used keys
+        self._results_memory = MemoryCache(self.MEMORY_CACHE_SIZE, self.MEMORY_CACHE_TTL)
+        self._face_memory = MemoryCache(self.FACE_MEMORY_CACHE_SIZE, self.MEMORY_CACHE_TTL)
+        self._gender_memory = MemoryCache(self.GENDER_MEMORY_CACHE_SIZE, self.MEMORY_CACHE_TTL)
+        self._query_gender_memory = MemoryCache(self.MEMORY_CACHE_SIZE, self.MEMORY_CACHE_TTL)
+
+        # Open persistent connections once instead of reconnecting per call
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=self.POOL_SIZE)
+        for _ in range(self.POOL_SIZE):
+            self._pool.put(self._connect())
+
+        # Lowercased source names for cache keys; there are only a handful of sources
+        self._source_keys: Dict[str, str] = {}
+
         # Initialize database
+        self._fts_enabled = False
         self._init_db()
 
+        # Hit counts are buffered so that reads never write to the database
+        self._pending_hits: Counter = Counter()
+        self._hits_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._run_periodically(self.HIT_FLUSH_INTERVAL, '_flush_hits', 'hits')
+        self._run_periodically(self.EXPIRY_SWEEP_INTERVAL, 'clear_expired', 'expiry')
+        self._run_periodically(self.MAINTENANCE_INTERVAL, '_maintain', 'maintenance')
+
+        # The threads and the exit hook hold the cache weakly, so dropping the last
+        # reference stops the threads and closes the connections; hits still
+        # buffered then are dropped. Exit is left to _flush_open_caches().
+        self._finalizer = weakref.finalize(self, _release_pool, self._stop_event, self._pool, self.POOL_SIZE)
+        self._finalizer.atexit = False
+        _open_caches.add(self)
+
+    def close(self):
+        """Flush buffered hit counts, stop maintenance threads and close all connections.
+
+        Waits for connections currently in use to be returned to the pool.
+        The cache must not be used after it has been closed.
+        """
+        if not self._finalizer.alive:
+            return
+
+        _open_caches.discard(self)
+        self._flush_hits()
+        self._finalizer()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new database connection with performance pragmas applied.
+
+        Returns:
+            SQLite connection in autocommit mode, usable from any thread
+        """
+        # A larger statement cache keeps every query shape (including the
+        # variable-length IN lookups) prepared on each pooled connection
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256
+        )
+        # WAL (enabled in _init_db) only needs NORMAL sync to stay consistent
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA busy_timeout=5000')
+        conn.execute('PRAGMA wal_autocheckpoint=1000')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-20000')
+        conn.execute('PRAGMA mmap_size=268435456')
+        # Truncate the WAL file after checkpoints instead of letting it stay at its peak size
+        conn.execute('PRAGMA journal_size_limit=67108864')
+        return conn
+
+    @contextmanager
+    def _conn(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection from the pool for the duration of a block."""
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection and run the block inside a single write transaction."""
+        with self._conn() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield conn
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+
+    def _run_periodically(self, interval: float, method: str, name: str):
+        """Run a maintenance method every interval seconds on a daemon thread.
+
+        The thread only holds a weak reference to the cache and exits once the
+        cache is closed or garbage collected.
+
+        Args:
+            interval: Seconds between runs
+            method: Name of the cache method to run
+            name: Short task name used for the thread name and error messages
+        """
+        cache_ref = weakref.ref(self)
+        stop_event = self._stop_event
+
+        def loop():
+            while not stop_event.wait(interval):
+                cache = cache_ref()
+                if cache is None:
+                    return
+                try:
+                    getattr(cache, method)()
+                except Exception as e:
+                    print(f"⚠ Cache maintenance task '{name}' failed: {e}")
+                del cache
+
+        threading.Thread(target=loop, name=f"image-cache-{name}", daemon=True).start()
+
+    def _flush_hits(self):
+        """Write buffered hit counts to the database in a single transaction."""
+        with self._hits_lock:
+            if not self._pending_hits:
+                return
+            pending_hits, self._pending_hits = self._pending_hits, Counter()
+
+        with self._transaction() as conn:
+            conn.executemany('''
+                UPDATE image_cache
+                SET hit_count = hit_count + ?
+                WHERE cache_key = ?
+            ''', [(count, cache_key) for cache_key, count in pending_hits.items()])
+
+    def _maintain(self):
+        """Reclaim free pages left by expiry sweeps and refresh query planner statistics."""
+        with self._conn() as conn:
+            # executescript steps the pragma to completion; execute() would free only one page
+            conn.executescript('PRAGMA incremental_vacuum(1000)')
+            conn.execute('PRAGMA optimize')
+
     def _init_db(self):
         """Initialize the database schema."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._conn() as conn:
+            # Incremental auto-vacuum lets _maintain() return freed pages to the OS
+            # without a full VACUUM. It only takes effect on a new database file,
+            # so it has to be set before anything else writes the header.
+            conn.execute('PRAGMA auto_vacuum=INCREMENTAL')
+
+            # WAL lets readers proceed while a writer commits; the mode is stored
+            # in the database file so setting it once covers every connection
+            journal_mode = conn.execute('PRAGMA journal_mode=WAL').fetchone()[0]
+
+            # Databases created before auto-vacuum was enabled need a one-off VACUUM to switch
+            if conn.execute('PRAGMA auto_vacuum').fetchone()[0] != 2:
+                try:
+                    conn.execute('VACUUM')
+                except sqlite3.OperationalError as e:
+                    print(f"⚠ Could not enable incremental auto-vacuum for {self.db_path}: {e}")
+        if journal_mode.lower() != 'wal':
+            print(f"⚠ SQLite WAL mode unavailable for {self.db_path} (using {journal_mode}); "
+                  f"keep the cache on a local filesystem for concurrent access")
+
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            self._create_schema(cursor)
+
+            schema_version = cursor.execute('PRAGMA user_version').fetchone()[0]
+            if schema_version < self.SCHEMA_VERSION:
+                self._migrate(cursor, schema_version)
+                cursor.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+
+            # Gather planner statistics once for databases that have never had them;
+            # afterwards PRAGMA optimize (see _maintain and close) keeps them current
+            has_stats = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone()
+            if not has_stats:
+                cursor.execute('ANALYZE')
+
+    def _create_schema(self, cursor: sqlite3.Cursor):
+        """Create tables and indexes if they do not exist yet.
 
+        Args:
+            cursor: Cursor inside an open transaction
+        """
         # Create cache table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS image_cache (
@@ -40,32 +350,48 @@ class ImageCache:
                 query TEXT NOT NULL,
                 entity_type TEXT NOT NULL,
                 source TEXT NOT NULL,
-                results TEXT NOT NULL,
+                results BLOB NOT NULL,
                 created_at INTEGER NOT NULL,
                 expires_at INTEGER NOT NULL,
                 hit_count INTEGER DEFAULT 0
             )
         ''')
 
+        # Face and gender results are keyed by a 16-byte URL hash rather than
+        # the URL itself, which keeps their primary key indexes small
+        strict = ' STRICT' if sqlite3.sqlite_version_info >= (3, 37, 0) else ''
+
         # Create face detection cache table
-        cursor.execute('''
+        cursor.execute(f'''
             CREATE TABLE IF NOT EXISTS face_detection_cache (
-                image_url TEXT PRIMARY KEY,
+                url_hash BLOB PRIMARY KEY,
+                image_url TEXT NOT NULL,
                 has_face INTEGER NOT NULL,
                 face_count INTEGER NOT NULL,
                 detected_at INTEGER NOT NULL,
                 expires_at INTEGER NOT NULL
-            )
+            ){strict}
         ''')
 
         # Create gender classification cache table
-        cursor.execute('''
+        cursor.execute(f'''
             CREATE TABLE IF NOT EXISTS gender_classification_cache (
-                image_url TEXT PRIMARY KEY,
+                url_hash BLOB PRIMARY KEY,
+                image_url TEXT NOT NULL,
                 gender TEXT NOT NULL,
                 classified_at INTEGER NOT NULL,
                 expires_at INTEGER NOT NULL
-            )
+            ){strict}
+        ''')
+
+        # Create expected-gender-per-person-query cache table
+        cursor.execute(f'''
+            CREATE TABLE IF NOT EXISTS query_gender_cache (
+                query_key TEXT PRIMARY KEY,
+                gender TEXT NOT NULL,
+                detected_at INTEGER NOT NULL,
+                expires_at INTEGER NOT NULL
+            ){strict}
         ''')
 
         # Create index for faster lookups
@@ -74,9 +400,11 @@ class ImageCache:
             ON image_cache(query, entity_type)
         ''')
 
+        # Covers the expiry filter and hit counts, so get_stats() and expiry
+        # sweeps never touch the main table with its result blobs
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_expires
-            ON image_cache(expires_at)
+            CREATE INDEX IF NOT EXISTS idx_expires_hits
+            ON image_cache(expires_at, hit_count)
         ''')
 
         cursor.execute('''
@@ -89,22 +417,138 @@ class ImageCache:
             ON gender_classification_cache(expires_at)
         ''')
 
-        conn.commit()
-        conn.close()
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_query_gender_expires
+            ON query_gender_cache(expires_at)
+        ''')
+
+        self._create_search_index(cursor)
+
+    def _create_search_index(self, cursor: sqlite3.Cursor):
+        """Create the full-text index used by search_cache(), if SQLite supports it.
+
+        The trigram tokenizer keeps substring semantics ("einst" matches
+        "Albert Einstein") while avoiding a full table scan.
+
+        Args:
+            cursor: Cursor inside an open transaction
+        """
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS image_cache_fts
+                USING fts5(query, content='image_cache', content_rowid='rowid', tokenize='trigram')
+            ''')
+        except sqlite3.OperationalError as e:
+            print(f"⚠ SQLite FTS5 trigram search unavailable ({e}); cache search will scan the table")
+            return
+
+        # Keep the external-content index in sync with image_cache
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS image_cache_fts_insert AFTER INSERT ON image_cache BEGIN
+                INSERT INTO image_cache_fts(rowid, query) VALUES (new.rowid, new.query);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS image_cache_fts_delete AFTER DELETE ON image_cache BEGIN
+                INSERT INTO image_cache_fts(image_cache_fts, rowid, query) VALUES ('delete', old.rowid, old.query);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS image_cache_fts_update AFTER UPDATE OF query ON image_cache BEGIN
+                INSERT INTO image_cache_fts(image_cache_fts, rowid, query) VALUES ('delete', old.rowid, old.query);
+                INSERT INTO image_cache_fts(rowid, query) VALUES (new.rowid, new.query);
+            END
+        ''')
+        self._fts_enabled = True
+
+    def _migrate(self, cursor: sqlite3.Cursor, from_version: int):
+        """Upgrade data written by an older version of the cache.
+
+        Args:
+            cursor: Cursor inside an open transaction
+            from_version: Schema version stored in the database
+        """
+        if from_version < 1:
+            # Cache keys used to be MD5 digests; rewrite them as plain composite keys
+            cursor.execute('''
+                UPDATE OR REPLACE image_cache
+                SET cache_key = lower(query) || '|' || lower(entity_type) || '|' || lower(source)
+                WHERE instr(cache_key, '|') = 0
+            ''')
+
+        if from_version < 2:
+            # Results used to be stored as uncompressed JSON
+            rows = cursor.execute('SELECT cache_key, results FROM image_cache').fetchall()
+            cursor.executemany(
+                'UPDATE image_cache SET results = ? WHERE cache_key = ?',
+                [(_encode_results(orjson.loads(results)), cache_key) for cache_key, results in rows]
+            )
+
+        if from_version < 3 and self._fts_enabled:
+            # Index entries cached before full-text search existed
+            cursor.execute("INSERT INTO image_cache_fts(image_cache_fts) VALUES ('rebuild')")
+
+        if from_version < 4:
+            # Face/gender caches used to be keyed by the full image URL
+            columns = [row[1] for row in cursor.execute('PRAGMA table_info(face_detection_cache)')]
+            if 'url_hash' not in columns:
+                cursor.execute('ALTER TABLE face_detection_cache RENAME TO face_detection_cache_old')
+                cursor.execute('ALTER TABLE gender_classification_cache RENAME TO gender_classification_cache_old')
+                # The expiry indexes moved with the renamed tables; recreate them on the new ones
+                cursor.execute('DROP INDEX idx_face_expires')
+                cursor.execute('DROP INDEX idx_gender_expires')
+                self._create_schema(cursor)
+
+                rows = cursor.execute('''
+                    SELECT image_url, has_face, face_count, detected_at, expires_at
+                    FROM face_detection_cache_old
+                ''').fetchall()
+                cursor.executemany(
+                    'INSERT INTO face_detection_cache VALUES (?, ?, ?, ?, ?, ?)',
+                    [(_url_hash(row[0]), *row) for row in rows]
+                )
+
+                rows = cursor.execute('''
+                    SELECT image_url, gender, classified_at, expires_at
+                    FROM gender_classification_cache_old
+                ''').fetchall()
+                cursor.executemany(
+                    'INSERT INTO gender_classification_cache VALUES (?, ?, ?, ?, ?)',
+                    [(_url_hash(row[0]), *row) for row in rows]
+                )
+
+                cursor.execute('DROP TABLE face_detection_cache_old')
+                cursor.execute('DROP TABLE gender_classification_cache_old')
+
+        if from_version < 5:
+            # Superseded by the covering idx_expires_hits index
+            cursor.execute('DROP INDEX IF EXISTS idx_expires')
 
     def _generate_cache_key(self, query: str, entity_type: str, source: str) -> str:
         """Generate a unique cache key.
 
+        The key is stored as-is in the primary key column, so no hashing is needed.
+
         Args:
             query: Search query
             entity_type: Type of entity
             source: Image source name
 
         Returns:
-            MD5 hash as cache key
+            Lowercase "query|entity_type|source" cache key
         """
-        key_string = f"{query.lower()}:{entity_type.lower()}:{source.lower()}"
-        return hashlib.md5(key_string.encode()).hexdigest()
+        return self._cache_key_prefix(query, entity_type) + self._source_key(source)
+
+    def _cache_key_prefix(self, query: str, entity_type: str) -> str:
+        """Build the "query|entity_type|" part of a cache key, shared by all sources."""
+        return f"{query.lower()}|{entity_type.lower()}|"
+
+    def _source_key(self, source: str) -> str:
+        """Get the lowercased source name used in cache keys, computing it once per source."""
+        source_key = self._source_keys.get(source)
+        if source_key is None:
+            source_key = self._source_keys[source] = source.lower()
+        return source_key
 
     def get(self, query: str, entity_type: str, source: str) -> Optional[List[Dict[str, Any]]]:
         """Get cached results if available and not expired.
@@ -117,37 +561,57 @@ class ImageCache:
         Returns:
             List of cached results or None if not found/expired
         """
-        cache_key = self._generate_cache_key(query, entity_type, source)
-        current_time = int(time.time())
-
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT results, hit_count FROM image_cache
-            WHERE cache_key = ? AND expires_at > ?
-        ''', (cache_key, current_time))
-
-        row = cursor.fetchone()
+        return self.get_many(query, entity_type, [source])[source]
 
-        if row:
-            results_json, hit_count = row
+    def get_many(self, query: str, entity_type: str, sources: List[str]) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+        """Get cached results for several sources with a single database lookup.
 
-            # Increment hit count
-            cursor.execute('''
-                UPDATE image_cache
-                SET hit_count = ?
-                WHERE cache_key = ?
-            ''', (hit_count + 1, cache_key))
-
-            conn.commit()
-            conn.close()
-
-            # Deserialize results
-            return json.loads(results_json)
+        Args:
+            query: Search query
+            entity_type: Type of entity
+            sources: Image source names
 
-        conn.close()
-        return None
+        Returns:
+            Dictionary mapping each source to its cached results, or None if not found/expired
+        """
+        # The query part of the key is the same for every source; build it once
+        prefix = self._cache_key_prefix(query, entity_type)
+        cache_keys = {source: prefix + self._source_key(source) for source in sources}
+        found: Dict[str, List[Dict[str, Any]]] = {}
+
+        # Serve hot entries from memory, skipping the SQL read and JSON decode
+        for cache_key in cache_keys.values():
+            results = self._results_memory.get(cache_key)
+            if results is not None:
+                found[cache_key] = results
+
+        missing_keys = [cache_key for cache_key in cache_keys.values() if cache_key not in found]
+
+        if missing_keys:
+            current_time = int(time.time())
+            placeholders = ', '.join('?' * len(missing_keys))
+
+            with self._conn() as conn:
+                rows = conn.execute(f'''
+                    SELECT cache_key, results, expires_at FROM image_cache
+                    WHERE expires_at > ? AND cache_key IN ({placeholders})
+                ''', (current_time, *missing_keys)).fetchall()
+
+            for cache_key, results_data, expires_at in rows:
+                # Deserialize results
+                results = _decode_results(results_data)
+                self._results_memory.set(cache_key, results, expires_at)
+                found[cache_key] = results
+
+        # Count hits in memory; they are written to the database periodically
+        if found:
+            with self._hits_lock:
+                self._pending_hits.update(found.keys())
+                flush_due = len(self._pending_hits) >= self.HIT_FLUSH_THRESHOLD
+            if flush_due:
+                self._flush_hits()
+
+        return {source: found.get(cache_key) for source, cache_key in cache_keys.items()}
 
     def set(self, query: str, entity_type: str, source: str, results: List[Dict[str, Any]]):
         """Cache search results.
@@ -158,25 +622,46 @@ class ImageCache:
             source: Image source name
             results: List of image results to cache
         """
-        cache_key = self._generate_cache_key(query, entity_type, source)
-        current_time = int(time.time())
-        expires_at = current_time + (self.ttl_days * 24 * 60 * 60)
+        self.set_many([(query, entity_type, source, results)])
 
-        # Serialize results
-        results_json = json.dumps(results)
+    def set_many(self, entries: List[Tuple[str, str, str, List[Dict[str, Any]]]]):
+        """Cache search results for several queries/sources in a single transaction.
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        Args:
+            entries: List of (query, entity_type, source, results) tuples
+        """
+        if not entries:
+            return
 
-        # Insert or replace cache entry
-        cursor.execute('''
-            INSERT OR REPLACE INTO image_cache
-            (cache_key, query, entity_type, source, results, created_at, expires_at, hit_count)
-            VALUES (?, ?, ?, ?, ?, ?, ?, 0)
-        ''', (cache_key, query, entity_type, source, results_json, current_time, expires_at))
+        current_time = int(time.time())
+        expires_at = current_time + (self.ttl_days * 24 * 60 * 60)
 
-        conn.commit()
-        conn.close()
+        # Serialize and compress results
+        rows = [
+            (self._generate_cache_key(query, entity_type, source), query, entity_type, source,
+             _encode_results(results), current_time, expires_at)
+            for query, entity_type, source, results in entries
+        ]
+
+        with self._transaction() as conn:
+            # Upsert rather than REPLACE: REPLACE deletes the old row without
+            # firing delete triggers, which would leave the search index stale
+            conn.executemany('''
+                INSERT INTO image_cache
+                (cache_key, query, entity_type, source, results, created_at, expires_at, hit_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 0)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    query = excluded.query,
+                    entity_type = excluded.entity_type,
+                    source = excluded.source,
+                    results = excluded.results,
+                    created_at = excluded.created_at,
+                    expires_at = excluded.expires_at,
+                    hit_count = 0
+            ''', rows)
+
+        for row in rows:
+            self._results_memory.pop(row[0])
 
     def clear_expired(self) -> int:
         """Remove expired cache entries.
@@ -186,22 +671,32 @@ class ImageCache:
         """
         current_time = int(time.time())
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # One write transaction for all tables keeps the lock short
+        with self._transaction() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute('DELETE FROM image_cache WHERE expires_at <= ?', (current_time,))
-        image_deleted_count = cursor.rowcount
+            cursor.execute('DELETE FROM image_cache WHERE expires_at <= ?', (current_time,))
+            image_deleted_count = cursor.rowcount
 
-        cursor.execute('DELETE FROM face_detection_cache WHERE expires_at <= ?', (current_time,))
-        face_deleted_count = cursor.rowcount
+            cursor.execute('DELETE FROM face_detection_cache WHERE expires_at <= ?', (current_time,))
+            face_deleted_count = cursor.rowcount
 
-        cursor.execute('DELETE FROM gender_classification_cache WHERE expires_at <= ?', (current_time,))
-        gender_deleted_count = cursor.rowcount
+            cursor.execute('DELETE FROM gender_classification_cache WHERE expires_at <= ?', (current_time,))
+            gender_deleted_count = cursor.rowcount
 
-        conn.commit()
-        conn.close()
+            cursor.execute('DELETE FROM query_gender_cache WHERE expires_at <= ?', (current_time,))
+            gender_deleted_count += cursor.rowcount
 
-        return image_deleted_count + face_deleted_count + gender_deleted_count
+        # In-memory entries carry their database expiry, so they lapse on their own
+
+        deleted_count = image_deleted_count + face_deleted_count + gender_deleted_count
+
+        # Return the pages freed by a large sweep to the OS
+        if deleted_count > self.VACUUM_AFTER_DELETES:
+            with self._conn() as conn:
+                conn.executescript('PRAGMA incremental_vacuum')
+
+        return deleted_count
 
     def clear_all(self) -> int:
         """Clear all cache entries.
@@ -209,20 +704,25 @@ class ImageCache:
         Returns:
             Number of entries removed
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._transaction() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute('DELETE FROM image_cache')
-        image_deleted_count = cursor.rowcount
+            cursor.execute('DELETE FROM image_cache')
+            image_deleted_count = cursor.rowcount
 
-        cursor.execute('DELETE FROM face_detection_cache')
-        face_deleted_count = cursor.rowcount
+            cursor.execute('DELETE FROM face_detection_cache')
+            face_deleted_count = cursor.rowcount
 
-        cursor.execute('DELETE FROM gender_classification_cache')
-        gender_deleted_count = cursor.rowcount
+            cursor.execute('DELETE FROM gender_classification_cache')
+            gender_deleted_count = cursor.rowcount
 
-        conn.commit()
-        conn.close()
+            cursor.execute('DELETE FROM query_gender_cache')
+            gender_deleted_count += cursor.rowcount
+
+        self._results_memory.clear()
+        self._face_memory.clear()
+        self._gender_memory.clear()
+        self._query_gender_memory.clear()
 
         return image_deleted_count + face_deleted_count + gender_deleted_count
 
@@ -232,57 +732,44 @@ class ImageCache:
         Returns:
             Dictionary with cache statistics
         """
-        current_time = int(time.time())
-
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # Include hits that are still buffered in memory
+        self._flush_hits()
 
-        # Total entries
-        cursor.execute('SELECT COUNT(*) FROM image_cache')
-        total_entries = cursor.fetchone()[0]
+        current_time = int(time.time())
 
-        # Active (non-expired) entries
-        cursor.execute('SELECT COUNT(*) FROM image_cache WHERE expires_at > ?', (current_time,))
-        active_entries = cursor.fetchone()[0]
+        with self._conn() as conn:
+            # Counts for every table and the database size in one statement
+            (total_entries, active_entries, total_hits,
+             face_cache_entries, faces_detected_count, db_size_bytes) = conn.execute('''
+                SELECT
+                    COUNT(*),
+                    COALESCE(SUM(expires_at > :now), 0),
+                    COALESCE(SUM(CASE WHEN expires_at > :now THEN hit_count END), 0),
+                    (SELECT COUNT(*) FROM face_detection_cache WHERE expires_at > :now),
+                    (SELECT COUNT(*) FROM face_detection_cache WHERE has_face = 1 AND expires_at > :now),
+                    (SELECT page_count * page_size FROM pragma_page_count(), pragma_page_size())
+                FROM image_cache
+            ''', {'now': current_time}).fetchone()
+
+            # Most popular queries
+            popular_queries = [
+                {
+                    'query': row[0],
+                    'entity_type': row[1],
+                    'source': row[2],
+                    'hits': row[3]
+                }
+                for row in conn.execute('''
+                    SELECT query, entity_type, source, hit_count
+                    FROM image_cache
+                    WHERE expires_at > ?
+                    ORDER BY hit_count DESC
+                    LIMIT 10
+                ''', (current_time,))
+            ]
 
-        # Expired entries
         expired_entries = total_entries - active_entries
 
-        # Total hit count
-        cursor.execute('SELECT SUM(hit_count) FROM image_cache WHERE expires_at > ?', (current_time,))
-        total_hits = cursor.fetchone()[0] or 0
-
-        # Most popular queries
-        cursor.execute('''
-            SELECT query, entity_type, source, hit_count
-            FROM image_cache
-            WHERE expires_at > ?
-            ORDER BY hit_count DESC
-            LIMIT 10
-        ''', (current_time,))
-        popular_queries = [
-            {
-                'query': row[0],
-                'entity_type': row[1],
-                'source': row[2],
-                'hits': row[3]
-            }
-            for row in cursor.fetchall()
-        ]
-
-        # Face detection cache stats
-        cursor.execute('SELECT COUNT(*) FROM face_detection_cache WHERE expires_at > ?', (current_time,))
-        face_cache_entries = cursor.fetchone()[0]
-
-        cursor.execute('SELECT COUNT(*) FROM face_detection_cache WHERE has_face = 1 AND expires_at > ?', (current_time,))
-        faces_detected_count = cursor.fetchone()[0]
-
-        # Database size
-        cursor.execute("SELECT page_count * page_size as size FROM pragma_page_count(), pragma_page_size()")
-        db_size_bytes = cursor.fetchone()[0]
-
-        conn.close()
-
         return {
             'total_entries': total_entries,
             'active_entries': active_entries,
@@ -303,24 +790,33 @@ class ImageCache:
         """Search for cached entries matching a query pattern.
 
         Args:
-            query_pattern: SQL LIKE pattern for query search
+            query_pattern: Case-insensitive substring to look for in cached queries
 
         Returns:
             List of matching cache entries
         """
         current_time = int(time.time())
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT query, entity_type, source, created_at, expires_at, hit_count
-            FROM image_cache
-            WHERE query LIKE ? AND expires_at > ?
-            ORDER BY hit_count DESC
-        ''', (f'%{query_pattern}%', current_time))
-
-        entries = [
+        with self._conn() as conn:
+            # Trigrams need at least three characters; shorter patterns fall back to a scan
+            if self._fts_enabled and len(query_pattern) >= 3:
+                phrase = '"' + query_pattern.replace('"', '""') + '"'
+                rows = conn.execute('''
+                    SELECT query, entity_type, source, created_at, expires_at, hit_count
+                    FROM image_cache
+                    WHERE rowid IN (SELECT rowid FROM image_cache_fts WHERE image_cache_fts MATCH ?)
+                    AND expires_at > ?
+                    ORDER BY hit_count DESC
+                ''', (phrase, current_time)).fetchall()
+            else:
+                rows = conn.execute('''
+                    SELECT query, entity_type, source, created_at, expires_at, hit_count
+                    FROM image_cache
+                    WHERE query LIKE ? AND expires_at > ?
+                    ORDER BY hit_count DESC
+                ''', (f'%{query_pattern}%', current_time)).fetchall()
+
+        return [
             {
                 'query': row[0],
                 'entity_type': row[1],
@@ -329,11 +825,42 @@ class ImageCache:
                 'expires_at': datetime.fromtimestamp(row[4]).isoformat(),
                 'hit_count': row[5]
             }
-            for row in cursor.fetchall()
+            for row in rows
         ]
 
-        conn.close()
-        return entries
+    def _lookup_urls(self, select: str, image_urls: List[str]) -> List[Tuple[Any, ...]]:
+        """Fetch unexpired rows for many image URLs using chunked IN (...) queries.
+
+        Args:
+            select: SELECT url_hash, ... FROM clause of a table keyed by url_hash
+            image_urls: Distinct URLs to look up
+
+        Returns:
+            Matching rows with url_hash replaced by the image URL, in no particular order
+        """
+        current_time = int(time.time())
+        rows: List[Tuple[Any, ...]] = []
+
+        if not image_urls:
+            return rows
+
+        urls_by_hash = {_url_hash(image_url): image_url for image_url in image_urls}
+        url_hashes = list(urls_by_hash)
+
+        with self._conn() as conn:
+            # Chunk to stay well below SQLite's bound-parameter limit
+            for i in range(0, len(url_hashes), self.BULK_LOOKUP_CHUNK):
+                chunk = url_hashes[i:i + self.BULK_LOOKUP_CHUNK]
+                placeholders = ', '.join('?' * len(chunk))
+                rows.extend(
+                    (urls_by_hash[row[0]], *row[1:])
+                    for row in conn.execute(
+                        f'{select} WHERE expires_at > ? AND url_hash IN ({placeholders})',
+                        (current_time, *chunk)
+                    )
+                )
+
+        return rows
 
     def get_face_detection(self, image_url: str) -> Optional[tuple[bool, int]]:
         """Get cached face detection result for an image URL.
@@ -344,25 +871,36 @@ class ImageCache:
         Returns:
             Tuple of (has_face, face_count) or None if not cached/expired
         """
-        current_time = int(time.time())
+        return self.get_face_detection_bulk([image_url]).get(image_url)
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def get_face_detection_bulk(self, image_urls: List[str]) -> Dict[str, Tuple[bool, int]]:
+        """Get cached face detection results for several image URLs at once.
 
-        cursor.execute('''
-            SELECT has_face, face_count FROM face_detection_cache
-            WHERE image_url = ? AND expires_at > ?
-        ''', (image_url, current_time))
+        Args:
+            image_urls: URLs of the images
 
-        row = cursor.fetchone()
-        conn.close()
+        Returns:
+            Dictionary mapping each cached, unexpired URL to (has_face, face_count);
+            URLs without a cached result are left out
+        """
+        found: Dict[str, Tuple[bool, int]] = {}
+
+        # Dedup passes probe the same URLs repeatedly; answer those from memory
+        for image_url in image_urls:
+            cached_result = self._face_memory.get(image_url)
+            if cached_result is not None:
+                found[image_url] = cached_result
 
-        if row:
-            has_face = bool(row[0])
-            face_count = row[1]
-            return has_face, face_count
+        missing_urls = list(dict.fromkeys(url for url in image_urls if url not in found))
 
-        return None
+        for image_url, has_face, face_count, expires_at in self._lookup_urls(
+            'SELECT url_hash, has_face, face_count, expires_at FROM face_detection_cache',
+            missing_urls
+        ):
+            found[image_url] = (bool(has_face), face_count)
+            self._face_memory.set(image_url, found[image_url], expires_at)
+
+        return found
 
     def set_face_detection(self, image_url: str, has_face: bool, face_count: int):
         """Cache face detection result for an image URL.
@@ -372,20 +910,34 @@ class ImageCache:
             has_face: Whether a face was detected
             face_count: Number of faces detected
         """
+        self.set_face_detection_bulk([(image_url, has_face, face_count)])
+
+    def set_face_detection_bulk(self, items: List[Tuple[str, bool, int]]):
+        """Cache several face detection results in a single transaction.
+
+        Args:
+            items: List of (image_url, has_face, face_count) tuples
+        """
+        if not items:
+            return
+
         current_time = int(time.time())
         expires_at = current_time + (self.ttl_days * 24 * 60 * 60)
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        rows = [
+            (_url_hash(image_url), image_url, int(has_face), face_count, current_time, expires_at)
+            for image_url, has_face, face_count in items
+        ]
 
-        cursor.execute('''
-            INSERT OR REPLACE INTO face_detection_cache
-            (image_url, has_face, face_count, detected_at, expires_at)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (image_url, int(has_face), face_count, current_time, expires_at))
+        with self._transaction() as conn:
+            conn.executemany('''
+                INSERT OR REPLACE INTO face_detection_cache
+                (url_hash, image_url, has_face, face_count, detected_at, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', rows)
 
-        conn.commit()
-        conn.close()
+        for image_url, has_face, face_count in items:
+            self._face_memory.set(image_url, (bool(has_face), face_count), expires_at)
 
     def get_gender_classification(self, image_url: str) -> Optional[str]:
         """Get cached gender classification result for an image URL.
@@ -396,23 +948,35 @@ class ImageCache:
         Returns:
             'male', 'female', or None if not cached/expired
         """
-        current_time = int(time.time())
+        return self.get_gender_classification_bulk([image_url]).get(image_url)
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def get_gender_classification_bulk(self, image_urls: List[str]) -> Dict[str, str]:
+        """Get cached gender classification results for several image URLs at once.
 
-        cursor.execute('''
-            SELECT gender FROM gender_classification_cache
-            WHERE image_url = ? AND expires_at > ?
-        ''', (image_url, current_time))
+        Args:
+            image_urls: URLs of the images
 
-        row = cursor.fetchone()
-        conn.close()
+        Returns:
+            Dictionary mapping each cached, unexpired URL to 'male' or 'female';
+            URLs without a cached result are left out
+        """
+        found: Dict[str, str] = {}
+
+        for image_url in image_urls:
+            cached_gender = self._gender_memory.get(image_url)
+            if cached_gender is not None:
+                found[image_url] = cached_gender
+
+        missing_urls = list(dict.fromkeys(url for url in image_urls if url not in found))
 
-        if row:
-            return row[0]
+        for image_url, gender, expires_at in self._lookup_urls(
+            'SELECT url_hash, gender, expires_at FROM gender_classification_cache',
+            missing_urls
+        ):
+            found[image_url] = gender
+            self._gender_memory.set(image_url, gender, expires_at)
 
-        return None
+        return found
 
     def set_gender_classification(self, image_url: str, gender: str):
         """Cache gender classification result for an image URL.
@@ -421,17 +985,90 @@ class ImageCache:
             image_url: URL of the image
             gender: Detected gender ('male' or 'female')
         """
+        self.set_gender_classification_bulk([(image_url, gender)])
+
+    def set_gender_classification_bulk(self, items: List[Tuple[str, str]]):
+        """Cache several gender classification results in a single transaction.
+
+        Args:
+            items: List of (image_url, gender) tuples
+        """
+        if not items:
+            return
+
         current_time = int(time.time())
         expires_at = current_time + (self.ttl_days * 24 * 60 * 60)
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        rows = [
+            (_url_hash(image_url), image_url, gender, current_time, expires_at)
+            for image_url, gender in items
+        ]
+
+        with self._transaction() as conn:
+            conn.executemany('''
+                INSERT OR REPLACE INTO gender_classification_cache
+                (url_hash, image_url, gender, classified_at, expires_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', rows)
 
-        cursor.execute('''
-            INSERT OR REPLACE INTO gender_classification_cache
-            (image_url, gender, classified_at, expires_at)
-            VALUES (?, ?, ?, ?)
-        ''', (image_url, gender, current_time, expires_at))
+        for image_url, gender in items:
+            self._gender_memory.set(image_url, gender, expires_at)
 
-        conn.commit()
-        conn.close()
+    def _query_gender_key(self, query: str) -> str:
+        """Normalize a person query so spelling variants share one cache entry.
+
+        Case, accents and runs of whitespace are ignored, so "José  Martí"
+        and "jose marti" map to the same key.
+        """
+        decomposed = unicodedata.normalize('NFKD', query.casefold())
+        without_accents = ''.join(c for c in decomposed if not unicodedata.combining(c))
+        return ' '.join(without_accents.split())
+
+    def get_query_gender(self, query: str) -> Optional[str]:
+        """Get the cached expected gender for a person query.
+
+        Args:
+            query: Search query (person name)
+
+        Returns:
+            'male', 'female', or None if not cached/expired
+        """
+        query_key = self._query_gender_key(query)
+
+        # Popular people are searched again and again; answer those from memory
+        cached_gender = self._query_gender_memory.get(query_key)
+        if cached_gender is not None:
+            return cached_gender
+
+        with self._conn() as conn:
+            row = conn.execute(
+                'SELECT gender, expires_at FROM query_gender_cache WHERE query_key = ? AND expires_at > ?',
+                (query_key, int(time.time()))
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        gender, expires_at = row
+        self._query_gender_memory.set(query_key, gender, expires_at)
+        return gender
+
+    def set_query_gender(self, query: str, gender: str):
+        """Cache the expected gender for a person query.
+
+        Args:
+            query: Search query (person name)
+            gender: Detected gender ('male' or 'female')
+        """
+        query_key = self._query_gender_key(query)
+        current_time = int(time.time())
+        expires_at = current_time + (self.ttl_days * 24 * 60 * 60)
+
+        with self._transaction() as conn:
+            conn.execute('''
+                INSERT OR REPLACE INTO query_gender_cache
+                (query_key, gender, detected_at, expires_at)
+                VALUES (?, ?, ?, ?)
+            ''', (query_key, gender, current_time, expires_at))
+
+        self._query_gender_memory.set(query_key, gender, expires_at)
@@ -40,11 +40,22 @@ class Config:
 
     # Gender filtering settings for person entities
     ENABLE_GENDER_FILTERING: bool = True
+    # DeepFace face detector used before gender analysis: 'opencv' (Haar cascade,
+    # no extra weights) or a DNN backend such as 'yunet' or 'ssd' (downloaded on first use)
+    GENDER_DETECTOR_BACKEND: str = os.getenv('GENDER_DETECTOR_BACKEND', 'opencv')
+    # Results per search checked for gender; the rest are kept unfiltered. Images are
+    # analysed one at a time in the request thread, so keep this well inside the worker timeout
+    MAX_GENDER_ANALYSIS_BATCH: int = int(os.getenv('MAX_GENDER_ANALYSIS_BATCH', 3))
+    # DeepFace analyses allowed to run at once across all request threads
+    GENDER_MAX_CONCURRENCY: int = int(os.getenv('GENDER_MAX_CONCURRENCY', max(1, (os.cpu_count() or 1) // 2)))
 
     # Image quality settings
     MIN_IMAGE_WIDTH: int = 800
     MIN_IMAGE_HEIGHT: int = 600
 
+    # Images larger than this are not downloaded for face/gender analysis
+    MAX_IMAGE_BYTES: int = 8 * 1024 * 1024
+
     @classmethod
     def validate(cls) -> dict:
         """Validate configuration and return status of API keys."""
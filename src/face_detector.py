@@ -1,12 +1,12 @@
 """Face detection module for verifying person images."""
 
+import concurrent.futures
+import cv2
 import face_recognition
 import numpy as np
 import requests
-from io import BytesIO
-from PIL import Image
-from typing import Optional, Tuple, TYPE_CHECKING
-from src.config import Config
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+from src.image_io import decode_image, download_image, downscale_image
 
 if TYPE_CHECKING:
     from src.cache import ImageCache
@@ -23,6 +23,15 @@ class FaceDetector:
     # Using "hog" for speed since we process many images
     DETECTION_MODEL = "hog"
 
+    # Images are downscaled so their longest side is at most this many pixels
+    # before detection, whose cost grows with the pixel count. HOG (with
+    # face_recognition's default 2x upsample) finds faces down to ~40px, so
+    # faces above MIN_FACE_SIZE_RATIO still survive the downscale.
+    MAX_DETECTION_DIMENSION = 1024
+
+    # Parallel image downloads when analyzing a batch of URLs
+    DOWNLOAD_WORKERS = 16
+
     def __init__(self, cache: Optional['ImageCache'] = None):
         """Initialize the face detector with face_recognition library.
 
@@ -55,59 +64,7 @@ class FaceDetector:
                 return cached_result
 
         try:
-            # Download the image
-            headers = {
-                'User-Agent': Config.USER_AGENT
-            }
-            response = requests.get(
-                image_url,
-                timeout=Config.REQUEST_TIMEOUT,
-                headers=headers,
-                stream=True
-            )
-            response.raise_for_status()
-
-            # Convert to PIL Image
-            img = Image.open(BytesIO(response.content))
-
-            # Convert to RGB if needed (face_recognition requires RGB)
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-
-            # Convert to numpy array
-            img_array = np.array(img)
-
-            # Get image dimensions
-            img_height, img_width = img_array.shape[:2]
-
-            # Detect faces using face_recognition library
-            # Returns list of face locations: [(top, right, bottom, left), ...]
-            face_locations = face_recognition.face_locations(
-                img_array,
-                model=self.DETECTION_MODEL
-            )
-
-            # Count valid faces (filter by size to reduce false positives)
-            valid_face_count = 0
-
-            for (top, right, bottom, left) in face_locations:
-                # Calculate face dimensions
-                face_width = right - left
-                face_height = bottom - top
-
-                # Check if face is large enough (filters out tiny false positives)
-                min_dimension = min(img_width, img_height) * self.MIN_FACE_SIZE_RATIO
-                if face_width >= min_dimension and face_height >= min_dimension:
-                    valid_face_count += 1
-
-            has_face = valid_face_count > 0
-
-            # Cache the result
-            if self.cache:
-                self.cache.set_face_detection(image_url, has_face, valid_face_count)
-
-            return has_face, valid_face_count
-
+            has_face, valid_face_count = self._detect_faces(image_url)
         except requests.exceptions.RequestException as e:
             print(f"Error downloading image for face detection: {e}")
             return False, 0
@@ -115,6 +72,144 @@ class FaceDetector:
             print(f"Error detecting faces: {e}")
             return False, 0
 
+        # Cache the result
+        if self.cache:
+            self.cache.set_face_detection(image_url, has_face, valid_face_count)
+
+        return has_face, valid_face_count
+
+    def detect_faces_from_urls(self, image_urls: List[str]) -> Dict[str, Tuple[bool, int]]:
+        """Detect faces in several images, writing new results to the cache at once.
+
+        Args:
+            image_urls: URLs of the images to analyze
+
+        Returns:
+            Dictionary mapping each URL to (has_face, face_count)
+        """
+        if not self.is_initialized:
+            return {image_url: (False, 0) for image_url in image_urls}
+
+        # Check cache first, for all URLs in one lookup; a failing cache only
+        # means every image is analyzed again
+        detections = {}
+        if self.cache:
+            try:
+                detections = self.cache.get_face_detection_bulk(image_urls)
+            except Exception as e:
+                print(f"⚠ Face detection cache lookup failed: {e}")
+        new_results = []
+
+        urls_to_detect = [url for url in dict.fromkeys(image_urls) if url not in detections]
+
+        if urls_to_detect:
+            # Download in the background and run detection on each image as it
+            # arrives, so network waits overlap with face detection
+            max_workers = min(self.DOWNLOAD_WORKERS, len(urls_to_detect))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_url = {
+                    executor.submit(download_image, image_url): image_url
+                    for image_url in urls_to_detect
+                }
+
+                for future in concurrent.futures.as_completed(future_to_url):
+                    # Workers return compressed bytes and we decode here, so only
+                    # one decoded image is held at a time; drop our reference too
+                    image_url = future_to_url.pop(future)
+                    try:
+                        has_face, valid_face_count = self._count_faces(
+                            decode_image(future.result(), self.MAX_DETECTION_DIMENSION)
+                        )
+                    except requests.exceptions.RequestException as e:
+                        print(f"Error downloading image for face detection: {e}")
+                        detections[image_url] = (False, 0)
+                        continue
+                    except Exception as e:
+                        print(f"Error detecting faces: {e}")
+                        detections[image_url] = (False, 0)
+                        continue
+
+                    detections[image_url] = (has_face, valid_face_count)
+                    new_results.append((image_url, has_face, valid_face_count))
+
+        # Cache all new results in one transaction
+        if self.cache:
+            try:
+                self.cache.set_face_detection_bulk(new_results)
+            except Exception as e:
+                print(f"⚠ Could not cache face detection results: {e}")
+
+        return detections
+
+    def _detect_faces(self, image_url: str) -> Tuple[bool, int]:
+        """Download an image and count the faces in it, without using the cache.
+
+        Args:
+            image_url: URL of the image to analyze
+
+        Returns:
+            Tuple of (has_face: bool, face_count: int)
+
+        Raises:
+            requests.exceptions.RequestException: If the image cannot be downloaded
+        """
+        return self._count_faces(self._download_image(image_url))
+
+    def _download_image(self, image_url: str) -> np.ndarray:
+        """Download an image and decode it into a BGR array.
+
+        Args:
+            image_url: URL of the image
+
+        Returns:
+            Image as a height x width x 3 BGR numpy array
+
+        Raises:
+            requests.exceptions.RequestException: If the image cannot be downloaded
+            ValueError: If the image is larger than Config.MAX_IMAGE_BYTES
+        """
+        return decode_image(download_image(image_url), self.MAX_DETECTION_DIMENSION)
+
+    def _count_faces(self, img_array: np.ndarray) -> Tuple[bool, int]:
+        """Count the faces in an image that are large enough to be meaningful.
+
+        Args:
+            img_array: Image as a BGR numpy array
+
+        Returns:
+            Tuple of (has_face: bool, face_count: int)
+        """
+        # Downscale large images; the size filter below is relative, so it needs no adjustment
+        img_array = downscale_image(img_array, self.MAX_DETECTION_DIMENSION)
+
+        # face_recognition requires RGB; converting after the downscale touches fewer pixels
+        img_array = cv2.cvtColor(img_array, cv2.COLOR_BGR2RGB)
+
+        # Get image dimensions
+        img_height, img_width = img_array.shape[:2]
+
+        # Detect faces using face_recognition library
+        # Returns list of face locations: [(top, right, bottom, left), ...]
+        face_locations = face_recognition.face_locations(
+            img_array,
+            model=self.DETECTION_MODEL
+        )
+
+        # Count valid faces (filter by size to reduce false positives)
+        valid_face_count = 0
+
+        for (top, right, bottom, left) in face_locations:
+            # Calculate face dimensions
+            face_width = right - left
+            face_height = bottom - top
+
+            # Check if face is large enough (filters out tiny false positives)
+            min_dimension = min(img_width, img_height) * self.MIN_FACE_SIZE_RATIO
+            if face_width >= min_dimension and face_height >= min_dimension:
+                valid_face_count += 1
+
+        return valid_face_count > 0, valid_face_count
+
     def is_available(self) -> bool:
         """Check if face detection is available."""
         return self.is_initialized
@@ -3,13 +3,14 @@
 # CRITICAL: Import CPU-only TensorFlow configuration FIRST
 from src.tf_cpu_init import configure_tensorflow_cpu
 
+import concurrent.futures
+import numpy as np
 import requests
-from io import BytesIO
-from PIL import Image
-from typing import Optional, Literal, TYPE_CHECKING
+from typing import Dict, List, Optional, Literal, TYPE_CHECKING
 from src.config import Config
+from src.image_io import decode_image, download_image, downscale_image
+import threading
 import time
-import gc
 
 if TYPE_CHECKING:
     from src.cache import ImageCache
@@ -43,6 +44,13 @@ else:
 class GenderClassifier:
     """Classify gender in images for person entity filtering."""
 
+    # Parallel image downloads when analyzing a batch of URLs
+    DOWNLOAD_WORKERS = 8
+
+    # Images are shrunk to this longest side before DeepFace runs its face detector;
+    # faces are cropped and resized to 224px for the gender model anyway
+    MAX_ANALYSIS_DIMENSION = 640
+
     def __init__(self, cache: Optional['ImageCache'] = None):
         """Initialize the gender classifier.
 
@@ -51,15 +59,34 @@ class GenderClassifier:
         """
         self.is_initialized = DEEPFACE_AVAILABLE
         self.cache = cache
-        self.last_analysis_time = 0
-        self.min_delay_between_calls = 0.5  # Minimum 500ms between DeepFace calls
+        # Bound concurrent DeepFace analyses (e.g. from several request threads)
+        # to the available cores instead of sleeping between calls
+        self._analysis_slots = threading.BoundedSemaphore(max(1, Config.GENDER_MAX_CONCURRENCY))
 
         if self.is_initialized:
+            self._warm_up()
             print("✓ Gender classification initialized (using DeepFace)")
         else:
             print("⚠ DeepFace not available - gender filtering disabled")
             print("  Install with: pip install deepface")
 
+    def _warm_up(self):
+        """Load the DeepFace gender model now instead of on the first real image.
+
+        DeepFace builds its models lazily; running one analysis on a small
+        synthetic image loads the weights and traces the TensorFlow graph up front.
+        """
+        try:
+            DeepFace.analyze(
+                img_path=np.zeros((64, 64, 3), dtype=np.uint8),
+                actions=['gender'],
+                enforce_detection=False,
+                silent=True,
+                detector_backend=Config.GENDER_DETECTOR_BACKEND
+            )
+        except Exception as e:
+            print(f"⚠ Could not preload DeepFace gender model: {e}")
+
     def classify_gender_from_url(self, image_url: str) -> Optional[Literal['male', 'female']]:
         """Classify the dominant gender in an image from a URL.
 
@@ -78,49 +105,121 @@ class GenderClassifier:
             if cached_result is not None:
                 return cached_result
 
-        # Rate limiting: Add delay between calls to prevent resource exhaustion
-        elapsed = time.time() - self.last_analysis_time
-        if elapsed < self.min_delay_between_calls:
-            time.sleep(self.min_delay_between_calls - elapsed)
+        gender = self._classify_gender(image_url)
+
+        # Cache the result
+        if gender and self.cache:
+            self.cache.set_gender_classification(image_url, gender)
+
+        return gender
+
+    def classify_gender_from_urls(self, image_urls: List[str]) -> Dict[str, Optional[Literal['male', 'female']]]:
+        """Classify several images, writing new results to the cache at once.
+
+        Args:
+            image_urls: URLs of the images to analyze
+
+        Returns:
+            Dictionary mapping each URL to 'male', 'female', or None
+        """
+        if not self.is_initialized:
+            return {image_url: None for image_url in image_urls}
+
+        # Check cache first, for all URLs in one lookup; a failing cache only
+        # means every image is analyzed again
+        classifications = {}
+        if self.cache:
+            try:
+                classifications = self.cache.get_gender_classification_bulk(image_urls)
+            except Exception as e:
+                print(f"[Gender Classification] ⚠ Cache lookup failed: {e}")
+        new_results = []
+
+        urls_to_classify = [url for url in dict.fromkeys(image_urls) if url not in classifications]
+
+        if urls_to_classify:
+            # Download in the background and analyze each image as it arrives,
+            # so network waits overlap with DeepFace inference
+            max_workers = min(self.DOWNLOAD_WORKERS, len(urls_to_classify))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_url = {
+                    executor.submit(download_image, image_url): image_url
+                    for image_url in urls_to_classify
+                }
+
+                for future in concurrent.futures.as_completed(future_to_url):
+                    # Drop our reference so each downloaded image can be freed once analyzed
+                    image_url = future_to_url.pop(future)
+                    try:
+                        img = decode_image(future.result(), self.MAX_ANALYSIS_DIMENSION)
+                    except requests.exceptions.RequestException as e:
+                        print(f"[Gender Classification] Error downloading image: {e}")
+                        classifications[image_url] = None
+                        continue
+                    except Exception as e:
+                        print(f"[Gender Classification] Error classifying gender: {e}")
+                        classifications[image_url] = None
+                        continue
+
+                    gender = self._classify_image(img)
+                    classifications[image_url] = gender
+                    if gender:
+                        new_results.append((image_url, gender))
+
+        # Cache all new results in one transaction
+        if self.cache:
+            try:
+                self.cache.set_gender_classification_bulk(new_results)
+            except Exception as e:
+                print(f"[Gender Classification] ⚠ Could not cache results: {e}")
+
+        return classifications
+
+    def _classify_gender(self, image_url: str) -> Optional[Literal['male', 'female']]:
+        """Download an image and classify its dominant gender, without using the cache.
+
+        Args:
+            image_url: URL of the image to analyze
 
-        tmp_path = None
+        Returns:
+            'male', 'female', or None if detection fails
+        """
         try:
-            # Download the image
-            headers = {
-                'User-Agent': Config.USER_AGENT
-            }
-            response = requests.get(
-                image_url,
-                timeout=Config.REQUEST_TIMEOUT,
-                headers=headers,
-                stream=True
-            )
-            response.raise_for_status()
+            # Decode to BGR, which is what DeepFace (OpenCV) works with;
+            # DeepFace accepts the array directly, so no temporary file is needed
+            img = decode_image(download_image(image_url), self.MAX_ANALYSIS_DIMENSION)
+        except requests.exceptions.RequestException as e:
+            print(f"[Gender Classification] Error downloading image: {e}")
+            return None
+        except Exception as e:
+            print(f"[Gender Classification] Error classifying gender: {e}")
+            return None
+
+        return self._classify_image(img)
 
-            # Convert to PIL Image and save to temporary location
-            img = Image.open(BytesIO(response.content))
+    def _classify_image(self, img: np.ndarray) -> Optional[Literal['male', 'female']]:
+        """Classify the dominant gender in a decoded image.
 
-            # Convert to RGB if needed
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
+        Args:
+            img: Image as a BGR numpy array
 
-            # Save to temporary file (DeepFace works with file paths)
-            import tempfile
-            with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as tmp_file:
-                img.save(tmp_file.name, format='JPEG')
-                tmp_path = tmp_file.name
+        Returns:
+            'male', 'female', or None if detection fails
+        """
+        try:
+            img = downscale_image(img, self.MAX_ANALYSIS_DIMENSION)
 
             # Analyze with DeepFace directly - no multiprocessing needed!
-            print(f"[Gender Classification] Analyzing image...")
             analysis_start = time.time()
 
-            analysis = DeepFace.analyze(
-                img_path=tmp_path,
-                actions=['gender'],
-                enforce_detection=False,
-                silent=True,
-                detector_backend='opencv'
-            )
+            with self._analysis_slots:
+                analysis = DeepFace.analyze(
+                    img_path=img,
+                    actions=['gender'],
+                    enforce_detection=False,
+                    silent=True,
+                    detector_backend=Config.GENDER_DETECTOR_BACKEND
+                )
 
             analysis_duration = time.time() - analysis_start
 
@@ -155,34 +254,13 @@ class GenderClassifier:
                     print(f"[Gender Classification] Could not determine gender from result: {result_data}")
                     return None
 
-            # Cache the result
-            if self.cache:
-                self.cache.set_gender_classification(image_url, gender)
-
-            # Update last analysis time for rate limiting
-            self.last_analysis_time = time.time()
-
-            # Force garbage collection to free memory
-            gc.collect()
-
             return gender
 
-        except requests.exceptions.RequestException as e:
-            print(f"[Gender Classification] Error downloading image: {e}")
-            return None
         except Exception as e:
             print(f"[Gender Classification] Error classifying gender: {e}")
             import traceback
             traceback.print_exc()
             return None
-        finally:
-            # Clean up temporary file
-            if tmp_path:
-                import os
-                try:
-                    os.unlink(tmp_path)
-                except Exception:
-                    pass
 
     def is_available(self) -> bool:
         """Check if gender classification is available."""
@@ -2,15 +2,24 @@
 
 import json
 import requests
-from typing import Optional, Literal
+from typing import Optional, Literal, TYPE_CHECKING
 from src.config import Config
+from src.http_session import session as http_session
+
+if TYPE_CHECKING:
+    from src.cache import ImageCache
 
 
 class GenderDetector:
     """Detects likely gender of person queries using LLM."""
 
-    def __init__(self):
-        """Initialize the gender detector."""
+    def __init__(self, cache: Optional['ImageCache'] = None):
+        """Initialize the gender detector.
+
+        Args:
+            cache: Optional ImageCache instance for caching the gender detected per query
+        """
+        self.cache = cache
         self.api_key = Config.ZEUS_LLM_API_KEY
         self.endpoint = Config.ZEUS_LLM_ENDPOINT
         self.pipeline_id = Config.ZEUS_LLM_PIPELINE_ID
@@ -31,6 +40,17 @@ class GenderDetector:
             print("[Gender Detection] Gender filtering is disabled or API key not configured")
             return None
 
+        # Check cache first; a person's name always maps to the same answer
+        if self.cache:
+            try:
+                cached_gender = self.cache.get_query_gender(query)
+            except Exception as e:
+                print(f"[Gender Detection] ⚠ Cache lookup failed: {e}")
+                cached_gender = None
+            if cached_gender:
+                print(f"[Gender Detection] ✓ Using cached gender for '{query}': {cached_gender}")
+                return cached_gender
+
         print(f"[Gender Detection] Detecting gender for query: '{query}'")
 
         try:
@@ -57,8 +77,8 @@ class GenderDetector:
                 'temperature': self.temperature
             }
 
-            # Call the LLM API
-            response = requests.post(
+            # Call the LLM API over the shared session, reusing its TLS connection
+            response = http_session.post(
                 self.endpoint,
                 headers=headers,
                 json=data,
@@ -82,7 +102,6 @@ class GenderDetector:
                 return None
 
             print(f"[Gender Detection] Detected gender: {gender}")
-            return gender
 
         except requests.exceptions.Timeout:
             print(f"[Gender Detection] ✗ LLM API request timed out")
@@ -96,3 +115,12 @@ class GenderDetector:
         except Exception as e:
             print(f"[Gender Detection] ✗ Unexpected error: {e}")
             return None
+
+        # A failed cache write must not discard the detected gender
+        if self.cache:
+            try:
+                self.cache.set_query_gender(query, gender)
+            except Exception as e:
+                print(f"[Gender Detection] ⚠ Could not cache gender: {e}")
+
+        return gender
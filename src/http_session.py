@@ -0,0 +1,40 @@
+"""Shared HTTP session for image downloads and API calls."""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from src.config import Config
+
+
+def _create_session() -> requests.Session:
+    """Create a session that keeps connections alive between requests.
+
+    Failed connections and 502/503/504 responses are retried once; reads
+    that time out are not. Every image download and source API call goes
+    through this session, so each retry can add up to a full
+    Config.REQUEST_TIMEOUT per URL: an unreachable host costs at most two
+    timeouts, and a slow one still fails after a single read timeout.
+
+    Returns:
+        requests.Session with a pooled adapter mounted for HTTP(S)
+    """
+    session = requests.Session()
+    session.headers['User-Agent'] = Config.USER_AGENT
+
+    # Image sources query the same APIs for every search, face detection and
+    # gender classification download many images from the same few hosts, and
+    # gender detection calls the same LLM endpoint for every person query;
+    # reusing connections saves a TCP + TLS handshake per request
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=1, connect=1, read=0, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    return session
+
+
+# Shared by all threads; requests sessions are safe for concurrent GETs
+session = _create_session()
@@ -1,6 +1,7 @@
 """Main image finder module that aggregates results from multiple sources."""
 
 import concurrent.futures
+import heapq
 from typing import List, Dict, Any, Optional
 from src.models import ImageResult
 from src.config import Config
@@ -20,6 +21,33 @@ from src.sources.europa import EuropaSource
 class LicensedImageFinder:
     """Find high-quality, license-safe images from multiple sources."""
 
+    # Base quality score by source reliability
+    SOURCE_SCORES = {
+        'Wikimedia Commons': 0.8,
+        'Unsplash': 0.9,
+        'Pexels': 0.85,
+        'Pixabay': 0.75,
+        'Info.gouv.fr': 0.95,  # High quality government source
+        'WhiteHouse.gov': 0.95,  # High quality government source
+        'European Commission': 0.95  # High quality government source
+    }
+
+    # License preference (more permissive = higher score)
+    LICENSE_SCORES = {
+        'Public Domain': 1.0,
+        'CC0 (Creative Commons Zero)': 1.0,
+        'Etalab 2.0 Open License': 0.95,
+        'Unsplash License': 0.95,
+        'Pexels License': 0.95,
+        'Pixabay License': 0.95,
+        'CC BY (Attribution)': 0.9,
+        'CC BY-SA (Attribution-ShareAlike)': 0.85,
+    }
+
+    # Threads shared by all searches for fetching from sources; threads are only
+    # started as needed, so this just caps concurrent fetches across requests
+    SOURCE_WORKERS = 32
+
     def __init__(self, enable_cache: bool = True):
         """Initialize the image finder with all available sources.
 
@@ -29,12 +57,27 @@ class LicensedImageFinder:
         self.sources = []
         self.cache = ImageCache() if enable_cache else None
         self.face_detector = FaceDetector(cache=self.cache) if Config.ENABLE_FACE_DETECTION else None
-        self.gender_detector = GenderDetector() if Config.ENABLE_GENDER_FILTERING else None
+        self.gender_detector = GenderDetector(cache=self.cache) if Config.ENABLE_GENDER_FILTERING else None
         self.gender_classifier = GenderClassifier(cache=self.cache) if Config.ENABLE_GENDER_FILTERING else None
 
         # Initialize all image sources
         self._init_sources()
 
+        # Reused by every find_images() call instead of starting new threads per search
+        self._source_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.SOURCE_WORKERS,
+            thread_name_prefix='image-source'
+        )
+
+    def close(self):
+        """Stop the source fetch threads and close the cache.
+
+        The finder must not be used after it has been closed.
+        """
+        self._source_pool.shutdown(wait=False)
+        if self.cache:
+            self.cache.close()
+
     def _init_sources(self):
         """Initialize all configured image sources."""
         # Wikimedia Commons (no API key needed)
@@ -64,39 +107,18 @@ class LicensedImageFinder:
         if Config.IGNIRA_API_KEY and Config.CRAWL_NINJA_API_KEY:
             self.sources.append(EuropaSource(Config.IGNIRA_API_KEY, Config.CRAWL_NINJA_API_KEY))
 
-    def _search_source_with_cache(self, source, query: str, entity_type: str) -> List[ImageResult]:
-        """Search a source with cache support.
+    def _fetch_from_source(self, source, query: str) -> List[ImageResult]:
+        """Search a source directly, bypassing the cache.
 
         Args:
             source: Image source to search
             query: Search query
-            entity_type: Type of entity
 
         Returns:
             List of ImageResult objects
         """
-        source_name = source.get_source_name()
-
-        # Check cache first
-        if self.cache:
-            cached_results = self.cache.get(query, entity_type, source_name)
-            if cached_results is not None:
-                print(f"✓ Cache hit for {source_name}: {query}")
-                # Convert cached dicts back to ImageResult objects
-                return [ImageResult(**result) for result in cached_results]
-
-        # Cache miss - fetch from API
-        print(f"→ Fetching from {source_name}: {query}")
-        results = source.search(query, Config.MAX_RESULTS_PER_SOURCE)
-
-        # Store in cache
-        if self.cache and results:
-            # Convert ImageResult objects to dicts for caching
-            cached_data = [result.to_dict() for result in results]
-            self.cache.set(query, entity_type, source_name, cached_data)
-            print(f"✓ Cached {len(results)} results from {source_name}")
-
-        return results
+        print(f"→ Fetching from {source.get_source_name()}: {query}")
+        return source.search(query, Config.MAX_RESULTS_PER_SOURCE)
 
     def find_images(
         self,
@@ -118,15 +140,36 @@ class LicensedImageFinder:
         """
         all_results = []
 
-        # Search all sources in parallel (with caching)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(self.sources)) as executor:
+        # Look up every source in the cache with a single query; if the cache
+        # can't be read, every source is fetched instead of failing the search
+        source_names = [source.get_source_name() for source in self.sources]
+        cached = {}
+        if self.cache:
+            try:
+                cached = self.cache.get_many(query, entity_type, source_names)
+            except Exception as e:
+                print(f"⚠ Cache lookup failed, fetching all sources: {e}")
+
+        sources_to_fetch = []
+        for source, source_name in zip(self.sources, source_names):
+            cached_results = cached.get(source_name)
+            if cached_results is not None:
+                print(f"✓ Cache hit for {source_name}: {query}")
+                # Convert cached dicts back to ImageResult objects
+                all_results.extend(ImageResult(**result) for result in cached_results)
+            else:
+                sources_to_fetch.append(source)
+
+        # Search remaining sources in parallel
+        if sources_to_fetch:
+            to_cache = []
+
             future_to_source = {
-                executor.submit(
-                    self._search_source_with_cache,
+                self._source_pool.submit(
+                    self._fetch_from_source,
                     source,
-                    query,
-                    entity_type
-                ): source for source in self.sources
+                    query
+                ): source for source in sources_to_fetch
             }
 
             for future in concurrent.futures.as_completed(future_to_source):
@@ -136,6 +179,21 @@ class LicensedImageFinder:
                     all_results.extend(results)
                 except Exception as e:
                     print(f"Error searching {source.get_source_name()}: {e}")
+                    continue
+
+                if results:
+                    # Convert ImageResult objects to dicts for caching
+                    to_cache.append((query, entity_type, source.get_source_name(),
+                                     [result.to_dict() for result in results]))
+
+            # Store all fetched sources in the cache in one transaction
+            if self.cache and to_cache:
+                try:
+                    self.cache.set_many(to_cache)
+                    for _, _, source_name, cached_data in to_cache:
+                        print(f"✓ Cached {len(cached_data)} results from {source_name}")
+                except Exception as e:
+                    print(f"⚠ Could not cache fetched results: {e}")
 
         # Filter by relevance: query must appear in title or description
         print(f"\nFiltering {len(all_results)} results for relevance to '{query}'...")
@@ -157,11 +215,12 @@ class LicensedImageFinder:
         # Calculate quality scores
         all_results = self._calculate_quality_scores(all_results, entity_type)
 
-        # Sort by quality score (highest first)
-        all_results.sort(key=lambda x: x.quality_score or 0, reverse=True)
+        # Select the top results by quality score (highest first); nlargest keeps
+        # only max_results items in a heap instead of sorting every result, and
+        # ties stay in their original order just as with a stable sort
+        top_results = heapq.nlargest(max_results, all_results, key=lambda x: x.quality_score or 0)
 
-        # Return top results
-        return [result.to_dict() for result in all_results[:max_results]]
+        return [result.to_dict() for result in top_results]
 
     def _filter_by_face_detection(self, results: List[ImageResult], require_faces: bool = True) -> List[ImageResult]:
         """Filter results based on face detection.
@@ -182,11 +241,14 @@ class LicensedImageFinder:
         filter_mode = "with faces" if require_faces else "without faces"
         print(f"\nFiltering {len(results)} results to keep only images {filter_mode}...")
 
+        # Detect all images in one batch so new results are cached in a single write
+        detections = self.face_detector.detect_faces_from_urls(
+            [result.thumbnail_url or result.image_url for result in results]
+        )
+
         for result in results:
             try:
-                has_face, face_count = self.face_detector.detect_faces_from_url(
-                    result.thumbnail_url or result.image_url
-                )
+                has_face, face_count = detections[result.thumbnail_url or result.image_url]
                 result.has_face = has_face
 
                 # Include based on require_faces parameter
@@ -244,15 +306,14 @@ class LicensedImageFinder:
             return results
 
         # Limit batch processing to prevent overwhelming the system
-        # Spawn mode makes each analysis slow (~30s) due to fresh model loading
-        MAX_GENDER_ANALYSIS_BATCH = 3
+        max_batch = Config.MAX_GENDER_ANALYSIS_BATCH
         total_results = len(results)
-        results_to_analyze = results[:MAX_GENDER_ANALYSIS_BATCH]
-        results_skipped = results[MAX_GENDER_ANALYSIS_BATCH:]
+        results_to_analyze = results[:max_batch]
+        results_skipped = results[max_batch:]
 
         print(f"\nFiltering {len(results_to_analyze)} results for gender: {expected_gender}")
         if results_skipped:
-            print(f"  (Processing first {MAX_GENDER_ANALYSIS_BATCH} of {total_results} results - each takes ~30s)")
+            print(f"  (Processing first {max_batch} of {total_results} results)")
 
         import time as time_module
         batch_start_time = time_module.time()
@@ -260,12 +321,15 @@ class LicensedImageFinder:
         filtered_results = []
         classification_errors = 0
 
+        # Classify all images in one batch so new results are cached in a single write
+        classifications = self.gender_classifier.classify_gender_from_urls(
+            [result.thumbnail_url or result.image_url for result in results_to_analyze]
+        )
+
         for idx, result in enumerate(results_to_analyze, 1):
             try:
-                print(f"  [{idx}/{len(results_to_analyze)}] Analyzing: {result.title[:50]}...")
-                detected_gender = self.gender_classifier.classify_gender_from_url(
-                    result.thumbnail_url or result.image_url
-                )
+                print(f"  [{idx}/{len(results_to_analyze)}] Analyzed: {result.title[:50]}...")
+                detected_gender = classifications[result.thumbnail_url or result.image_url]
 
                 if detected_gender == expected_gender:
                     print(f"  ✓ Gender match ({detected_gender}): {result.title[:50]}")
@@ -318,25 +382,28 @@ class LicensedImageFinder:
         if not significant_words:
             significant_words = query_words
 
+        # Determine how many query words a relevant result must contain; this
+        # depends only on the query, so it is worked out once for all results
+        if len(significant_words) == 1:
+            # Single word: must be present
+            required_matches = 1
+        elif len(significant_words) == 2:
+            # Two words: both must be present (e.g., "Le Monde" + "journal")
+            required_matches = 2
+        else:
+            # Three+ words: require at least 50% match
+            required_matches = len(significant_words) * 0.5
+
         for result in results:
             title = (result.title or '').lower()
             description = (result.description or '').lower()
-            combined_text = f"{title} {description}"
-
-            # Count how many significant words from query appear in title or description
-            matches = [word for word in significant_words if word in combined_text]
-
-            # Determine if result is relevant based on number of query words
-            is_relevant = False
-            if len(significant_words) == 1:
-                # Single word: must be present
-                is_relevant = len(matches) >= 1
-            elif len(significant_words) == 2:
-                # Two words: both must be present (e.g., "Le Monde" + "journal")
-                is_relevant = len(matches) >= 2
-            else:
-                # Three+ words: require at least 50% match
-                is_relevant = len(matches) >= (len(significant_words) * 0.5)
+
+            # Count how many significant words from query appear in title or description;
+            # query words contain no spaces, so searching each field separately finds
+            # the same matches without building a combined string
+            matches = [word for word in significant_words if word in title or word in description]
+
+            is_relevant = len(matches) >= required_matches
 
             if is_relevant:
                 filtered_results.append(result)
@@ -360,24 +427,22 @@ class LicensedImageFinder:
         Returns:
             List of ImageResult objects with quality scores
         """
+        is_person = entity_type.lower() == "person"
+
+        # Bind the lookups once instead of resolving them for every result
+        source_score = self.SOURCE_SCORES.get
+        license_score = self.LICENSE_SCORES.get
+        min_width, min_height = Config.MIN_IMAGE_WIDTH, Config.MIN_IMAGE_HEIGHT
+
         for result in results:
             score = 0.0
 
             # Base score from source reliability
-            source_scores = {
-                'Wikimedia Commons': 0.8,
-                'Unsplash': 0.9,
-                'Pexels': 0.85,
-                'Pixabay': 0.75,
-                'Info.gouv.fr': 0.95,  # High quality government source
-                'WhiteHouse.gov': 0.95,  # High quality government source
-                'European Commission': 0.95  # High quality government source
-            }
-            score += source_scores.get(result.source, 0.5)
+            score += source_score(result.source, 0.5)
 
             # Image size quality
             if result.width and result.height:
-                if result.width >= Config.MIN_IMAGE_WIDTH and result.height >= Config.MIN_IMAGE_HEIGHT:
+                if result.width >= min_width and result.height >= min_height:
                     score += 0.5
                     # Bonus for high resolution
                     if result.width >= 1920 and result.height >= 1080:
@@ -392,21 +457,11 @@ class LicensedImageFinder:
                 score += 0.15
 
             # Face detection bonus for person entities
-            if entity_type.lower() == "person" and result.has_face:
+            if is_person and result.has_face:
                 score += 0.5
 
             # License preference (more permissive = higher score)
-            license_scores = {
-                'Public Domain': 1.0,
-                'CC0 (Creative Commons Zero)': 1.0,
-                'Etalab 2.0 Open License': 0.95,
-                'Unsplash License': 0.95,
-                'Pexels License': 0.95,
-                'Pixabay License': 0.95,
-                'CC BY (Attribution)': 0.9,
-                'CC BY-SA (Attribution-ShareAlike)': 0.85,
-            }
-            score += license_scores.get(result.license_type, 0.5)
+            score += license_score(result.license_type, 0.5)
 
             result.quality_score = min(score, 5.0)  # Cap at 5.0
 
@@ -0,0 +1,125 @@
+"""Helpers for downloading and decoding images."""
+
+import cv2
+import numpy as np
+from io import BytesIO
+from typing import Optional
+from PIL import Image
+from src.config import Config
+from src.http_session import session as http_session
+
+
+def download_image(image_url: str) -> bytes:
+    """Download an image over the shared session, refusing oversized files.
+
+    The size is checked against Content-Length before the body is read, and
+    the body is read at most Config.MAX_IMAGE_BYTES + 1 bytes, so huge files
+    are abandoned early instead of being buffered in full.
+
+    Args:
+        image_url: URL of the image
+
+    Returns:
+        Encoded image file contents
+
+    Raises:
+        requests.exceptions.RequestException: If the image cannot be downloaded
+        ValueError: If the image is larger than Config.MAX_IMAGE_BYTES
+    """
+    with http_session.get(image_url, timeout=Config.REQUEST_TIMEOUT, stream=True) as response:
+        response.raise_for_status()
+
+        content_length = response.headers.get('Content-Length', '')
+        if content_length.isdigit() and int(content_length) > Config.MAX_IMAGE_BYTES:
+            raise ValueError(f"Image too large ({int(content_length)} bytes): {image_url}")
+
+        data = response.raw.read(Config.MAX_IMAGE_BYTES + 1, decode_content=True)
+
+    if len(data) > Config.MAX_IMAGE_BYTES:
+        raise ValueError(f"Image too large (over {Config.MAX_IMAGE_BYTES} bytes): {image_url}")
+
+    return data
+
+
+# JPEG scale factors libjpeg can apply while decoding, largest first
+_REDUCED_DECODE_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
+
+
+def _decode_flags(data: bytes, max_dimension: Optional[int]) -> int:
+    """Choose the cv2.imdecode flags for decoding data at no more than needed size.
+
+    JPEGs much larger than max_dimension are decoded at 1/2, 1/4 or 1/8 scale,
+    which libjpeg does in the DCT domain, using the largest factor that keeps
+    the longest side at or above max_dimension. Only the header is parsed here.
+    """
+    if max_dimension is None:
+        return cv2.IMREAD_COLOR
+
+    try:
+        with Image.open(BytesIO(data)) as pil_img:
+            if pil_img.format != 'JPEG':
+                return cv2.IMREAD_COLOR
+            longest_side = max(pil_img.size)
+    except Exception:
+        return cv2.IMREAD_COLOR
+
+    for factor, flags in _REDUCED_DECODE_FLAGS:
+        if longest_side // factor >= max_dimension:
+            return flags
+
+    return cv2.IMREAD_COLOR
+
+
+def decode_image(data: bytes, max_dimension: Optional[int] = None) -> np.ndarray:
+    """Decode encoded image bytes into a BGR array.
+
+    OpenCV decodes straight into a BGR array (libjpeg-turbo for JPEG),
+    avoiding PIL's intermediate image object and the copy made by np.array().
+    Formats OpenCV cannot read (e.g. GIF) fall back to PIL.
+
+    Args:
+        data: Encoded image file contents
+        max_dimension: Optional size the caller will work at; large JPEGs are
+            then decoded at a reduced scale whose longest side is still at least this
+
+    Returns:
+        Image as a height x width x 3 uint8 array in BGR channel order
+
+    Raises:
+        PIL.UnidentifiedImageError: If the data is not a readable image
+    """
+    img = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), _decode_flags(data, max_dimension))
+    if img is None:
+        with Image.open(BytesIO(data)) as pil_img:
+            img = cv2.cvtColor(np.asarray(pil_img.convert('RGB')), cv2.COLOR_RGB2BGR)
+    return img
+
+
+def downscale_image(img: np.ndarray, max_dimension: int) -> np.ndarray:
+    """Shrink an image so its longest side is at most max_dimension.
+
+    Detectors' cost grows with pixel count, so large photos are reduced
+    (with INTER_AREA, which avoids aliasing) before analysis. Smaller images
+    are returned unchanged.
+
+    Args:
+        img: Image as a height x width x channels array
+        max_dimension: Maximum length of the longest side in pixels
+
+    Returns:
+        The resized image, or img itself if it already fits
+    """
+    img_height, img_width = img.shape[:2]
+    scale = max_dimension / max(img_height, img_width)
+    if scale >= 1.0:
+        return img
+
+    return cv2.resize(
+        img,
+        (int(img_width * scale), int(img_height * scale)),
+        interpolation=cv2.INTER_AREA
+    )
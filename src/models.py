@@ -1,6 +1,6 @@
 """Data models for licensed images."""
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Optional, Dict, Any
 from enum import Enum
 
@@ -48,7 +48,9 @@ class ImageResult:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        # Every field is a plain scalar, so a shallow read of the instance dict
+        # gives the same result as asdict() without its recursive deep copies
+        return {k: v for k, v in vars(self).items() if v is not None}
 
     def is_commercial_safe(self) -> bool:
         """Check if image is safe for commercial use."""
@@ -1,14 +1,19 @@
 """European Commission (commission.europa.eu) image source using Ignira search and Crawl.ninja scraping."""
 
 import requests
-import re
-from typing import List, Optional
-from src.sources.base import ImageSource
+from typing import List
+from src.sources.scraped import (
+    COPYRIGHTED_SNIPPET_SOURCES,
+    COPYRIGHTED_SOURCES,
+    ScrapedPageSource,
+    compile_credit_patterns,
+)
 from src.models import ImageResult, LicenseType
 from src.config import Config
+from src.http_session import session as http_session
 
 
-class EuropaSource(ImageSource):
+class EuropaSource(ScrapedPageSource):
     """Search commission.europa.eu for European Commission images under CC BY 4.0 license.
 
     This source:
@@ -19,26 +24,19 @@ class EuropaSource(ImageSource):
     """
 
     IGNIRA_BASE_URL = "https://api.ignira.xyz/api/search"
-    CRAWL_NINJA_BASE_URL = "https://api.crawl.ninja/scrape/markdown"
 
-    def __init__(self, ignira_api_key: str = None, crawl_ninja_api_key: str = None):
-        """Initialize with both API keys.
+    # Common credit patterns in English, compiled once and tried in priority order
+    CREDIT_PATTERNS = compile_credit_patterns('credit', 'photo', 'image', 'source', '©', 'copyright', 'photographer')
 
-        Args:
-            ignira_api_key: API key for Ignira search
-            crawl_ninja_api_key: API key for Crawl.ninja scraping
-        """
-        super().__init__(api_key=ignira_api_key)
-        self.ignira_api_key = ignira_api_key
-        self.crawl_ninja_api_key = crawl_ninja_api_key
+    # Explicit credit lines looked for in search snippets before a page is scraped
+    SNIPPET_CREDIT_KEYWORDS = ('credit', '©', 'copyright')
+
+    # Snippet credits need whole words, see _preliminary_copyright_check()
+    SNIPPET_EXCLUDED_SOURCES = COPYRIGHTED_SNIPPET_SOURCES
 
     def get_source_name(self) -> str:
         return "European Commission"
 
-    def is_available(self) -> bool:
-        """Check if both API keys are configured."""
-        return self.ignira_api_key is not None and self.crawl_ninja_api_key is not None
-
     def search(self, query: str, max_results: int = 10) -> List[ImageResult]:
         """Search commission.europa.eu for images.
 
@@ -88,6 +86,8 @@ class EuropaSource(ImageSource):
 
             # Step 2: For each result, scrape the page and check credits
             print(f"\n[European Commission] STEP 2: Processing each result (relevance + credit filtering)")
+            relevant_results = []
+            skipped_before_scrape = 0
             for idx, search_result in enumerate(filtered_results, 1):
                 print(f"\n[European Commission] --- Result {idx}/{len(filtered_results)} ---")
                 print(f"[European Commission]   Title: {search_result.get('title', 'No title')}")
@@ -108,15 +108,25 @@ class EuropaSource(ImageSource):
 
                 print(f"[European Commission]   ✓ Relevant: Query found in {'title' if query.lower() in title.lower() else 'description'}")
 
-                # Extract image credit from the page
-                credit = self._extract_image_credit(search_result['url'], idx, len(filtered_results))
+                # Skip the scrape when the snippet already credits a copyrighted source
+                if self._preliminary_copyright_check(search_result):
+                    print(f"[European Commission]   ✗ SKIPPED: Snippet credits a copyrighted source (page not scraped)")
+                    skipped_before_scrape += 1
+                    continue
+
+                relevant_results.append((idx, search_result))
 
+            if skipped_before_scrape:
+                print(f"\n[European Commission] Skipped {skipped_before_scrape} result(s) on their snippet credit without scraping")
+
+            # Page credits are scraped concurrently but taken in search order
+            for idx, search_result, credit in self._scrape_credits(relevant_results, len(filtered_results)):
                 # Step 3: Filter out copyrighted images (AP, Reuters, Getty, etc.)
                 if credit and self._is_copyrighted(credit):
-                    print(f"[European Commission]   ✗ SKIPPED: Copyrighted credit detected")
+                    print(f"[European Commission]   ✗ SKIPPED (result {idx}): Copyrighted credit detected")
                     continue  # Skip copyrighted images
 
-                print(f"[European Commission]   ✓ INCLUDED: Eligible for CC BY 4.0")
+                print(f"[European Commission]   ✓ INCLUDED (result {idx}): Eligible for CC BY 4.0")
 
                 # Create ImageResult for CC BY 4.0 eligible images
                 result = ImageResult(
@@ -191,7 +201,7 @@ class EuropaSource(ImageSource):
             'User-Agent': Config.USER_AGENT
         }
 
-        response = requests.post(
+        response = http_session.post(
             self.IGNIRA_BASE_URL,
             headers=actual_headers,
             json=payload,
@@ -213,91 +223,8 @@ class EuropaSource(ImageSource):
 
         return results
 
-    def _extract_image_credit(self, url: str, idx: int = 0, total: int = 0) -> Optional[str]:
-        """Extract image credit from a page using Crawl.ninja scraping.
-
-        Args:
-            url: URL of the page to scrape
-            idx: Current result index (for logging)
-            total: Total results (for logging)
-
-        Returns:
-            Image credit text or None if not found
-        """
-        try:
-            print(f"[European Commission]   Scraping page with Crawl.ninja...")
-
-            headers = {
-                'X-API-Key': self.crawl_ninja_api_key,
-                'Content-Type': 'application/json'
-            }
-
-            payload = {
-                'url': url
-            }
-
-            print(f"[European Commission]     Request: {self.CRAWL_NINJA_BASE_URL}")
-            print(f"[European Commission]     Timeout: {Config.SCRAPING_TIMEOUT}s")
-
-            response = requests.post(
-                self.CRAWL_NINJA_BASE_URL,
-                headers=headers,
-                json=payload,
-                timeout=Config.SCRAPING_TIMEOUT  # Use dedicated scraping timeout
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            print(f"[European Commission]     ✓ Scraping successful (status: {response.status_code})")
-
-            if data.get('success') and data.get('data'):
-                markdown = data['data'].get('markdown', '')
-
-                print(f"[European Commission]     Scraped content length: {len(markdown)} chars")
-                print(f"[European Commission]     First 300 chars of markdown:")
-                print(f"[European Commission]       {markdown[:300]}")
-
-                # Look for common credit patterns in English
-                credit_patterns = [
-                    ('credit', r'(?i)credit[:\s]*([^\n\.]+)'),
-                    ('photo', r'(?i)photo[:\s]*([^\n\.]+)'),
-                    ('image', r'(?i)image[:\s]*([^\n\.]+)'),
-                    ('source', r'(?i)source[:\s]*([^\n\.]+)'),
-                    ('©', r'(?i)©[:\s]*([^\n\.]+)'),
-                    ('copyright', r'(?i)copyright[:\s]*([^\n\.]+)'),
-                    ('photographer', r'(?i)photographer[:\s]*([^\n\.]+)'),
-                ]
-
-                print(f"[European Commission]     Attempting credit extraction with {len(credit_patterns)} patterns...")
-                for pattern_name, pattern in credit_patterns:
-                    match = re.search(pattern, markdown)
-                    if match:
-                        credit = match.group(1).strip()
-                        print(f"[European Commission]     ✓ Credit found with pattern '{pattern_name}': {credit}")
-                        print(f"[European Commission]     Checking for copyrighted sources...")
-                        is_copyrighted = self._is_copyrighted(credit)
-                        if is_copyrighted:
-                            print(f"[European Commission]     ⚠ Copyrighted source detected in credit!")
-                        else:
-                            print(f"[European Commission]     ✓ No copyrighted sources detected")
-                        return credit
-                    else:
-                        print(f"[European Commission]       Pattern '{pattern_name}' - no match")
-
-                print(f"[European Commission]     ✗ No credit found with any pattern")
-            else:
-                print(f"[European Commission]     ✗ Scraping failed or no data returned")
-
-            return None
-
-        except requests.exceptions.RequestException as e:
-            print(f"[European Commission]   ✗ Error scraping page: {e}")
-            return None
-        except Exception as e:
-            print(f"[European Commission]   ✗ Unexpected error scraping: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+    def _is_excluded_credit(self, credit: str) -> bool:
+        return self._is_copyrighted(credit)
 
     def _is_copyrighted(self, credit: str) -> bool:
         """Check if credit contains copyrighted sources (AP, Reuters, Getty, etc.).
@@ -311,24 +238,10 @@ class EuropaSource(ImageSource):
         if not credit:
             return False
 
-        # Check for common copyrighted news/photo agencies
-        copyrighted_sources = [
-            'ap',  # Associated Press
-            'reuters',
-            'getty',
-            'getty images',
-            'afp',  # Agence France-Presse
-            'upi',  # United Press International
-            'epa',  # European Pressphoto Agency
-            'shutterstock',
-            'alamy',
-            'corbis',
-        ]
-
-        credit_lower = credit.lower()
-        for source in copyrighted_sources:
-            if source in credit_lower:
-                print(f"[European Commission]     Found copyrighted source: {source}")
-                return True
+        # One scan over the credit instead of a substring search per agency
+        match = COPYRIGHTED_SOURCES.search(credit.lower())
+        if match:
+            print(f"[European Commission]     Found copyrighted source: {match.group()}")
+            return True
 
         return False
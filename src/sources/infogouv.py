@@ -2,13 +2,14 @@
 
 import requests
 import re
-from typing import List, Optional
-from src.sources.base import ImageSource
+from typing import List
+from src.sources.scraped import ScrapedPageSource, compile_credit_patterns
 from src.models import ImageResult, LicenseType
 from src.config import Config
+from src.http_session import session as http_session
 
 
-class InfoGouvSource(ImageSource):
+class InfoGouvSource(ScrapedPageSource):
     """Search info.gouv.fr for French government images under Etalab 2.0 license.
 
     This source:
@@ -19,26 +20,18 @@ class InfoGouvSource(ImageSource):
     """
 
     IGNIRA_BASE_URL = "https://api.ignira.xyz/api/search"
-    CRAWL_NINJA_BASE_URL = "https://api.crawl.ninja/scrape/markdown"
 
-    def __init__(self, ignira_api_key: str = None, crawl_ninja_api_key: str = None):
-        """Initialize with both API keys.
+    # Common credit patterns in French, compiled once and tried in priority order
+    CREDIT_PATTERNS = compile_credit_patterns('crédit', 'photo', 'source', '©', 'copyright')
 
-        Args:
-            ignira_api_key: API key for Ignira search
-            crawl_ninja_api_key: API key for Crawl.ninja scraping
-        """
-        super().__init__(api_key=ignira_api_key)
-        self.ignira_api_key = ignira_api_key
-        self.crawl_ninja_api_key = crawl_ninja_api_key
+    # Explicit credit lines looked for in search snippets before a page is scraped
+    SNIPPET_CREDIT_KEYWORDS = ('crédit', '©', 'copyright')
+    SNIPPET_EXCLUDED_SOURCES = re.compile(r'\bafp\b')
+    EXCLUDED_CREDIT_NAME = "AFP"
 
     def get_source_name(self) -> str:
         return "Info.gouv.fr"
 
-    def is_available(self) -> bool:
-        """Check if both API keys are configured."""
-        return self.ignira_api_key is not None and self.crawl_ninja_api_key is not None
-
     def search(self, query: str, max_results: int = 10) -> List[ImageResult]:
         """Search info.gouv.fr for images.
 
@@ -88,6 +81,8 @@ class InfoGouvSource(ImageSource):
 
             # Step 2: For each result, scrape the page and check credits
             print(f"\n[Info.gouv.fr] STEP 2: Processing each result (relevance + credit filtering)")
+            relevant_results = []
+            skipped_before_scrape = 0
             for idx, search_result in enumerate(filtered_results, 1):
                 print(f"\n[Info.gouv.fr] --- Result {idx}/{len(filtered_results)} ---")
                 print(f"[Info.gouv.fr]   Title: {search_result.get('title', 'No title')}")
@@ -117,15 +112,25 @@ class InfoGouvSource(ImageSource):
 
                 print(f"[Info.gouv.fr]   ✓ Thumbnail validated: Not a sidebar/footer personality photo")
 
-                # Extract image credit from the page
-                credit = self._extract_image_credit(search_result['url'], idx, len(filtered_results))
+                # Skip the scrape when the snippet already credits AFP
+                if self._preliminary_copyright_check(search_result):
+                    print(f"[Info.gouv.fr]   ✗ SKIPPED: Snippet credits AFP (page not scraped)")
+                    skipped_before_scrape += 1
+                    continue
+
+                relevant_results.append((idx, search_result))
+
+            if skipped_before_scrape:
+                print(f"\n[Info.gouv.fr] Skipped {skipped_before_scrape} result(s) on their snippet credit without scraping")
 
+            # Page credits are scraped concurrently but taken in search order
+            for idx, search_result, credit in self._scrape_credits(relevant_results, len(filtered_results)):
                 # Step 3: Filter out AFP-credited images
                 if credit and self._is_afp_credit(credit):
-                    print(f"[Info.gouv.fr]   ✗ SKIPPED: AFP credit detected")
+                    print(f"[Info.gouv.fr]   ✗ SKIPPED (result {idx}): AFP credit detected")
                     continue  # Skip AFP images
 
-                print(f"[Info.gouv.fr]   ✓ INCLUDED: Eligible for Etalab 2.0")
+                print(f"[Info.gouv.fr]   ✓ INCLUDED (result {idx}): Eligible for Etalab 2.0")
 
                 # Create ImageResult for Etalab 2.0 eligible images
                 result = ImageResult(
@@ -200,7 +205,7 @@ class InfoGouvSource(ImageSource):
             'User-Agent': Config.USER_AGENT
         }
 
-        response = requests.post(
+        response = http_session.post(
             self.IGNIRA_BASE_URL,
             headers=actual_headers,
             json=payload,
@@ -222,89 +227,8 @@ class InfoGouvSource(ImageSource):
 
         return results
 
-    def _extract_image_credit(self, url: str, idx: int = 0, total: int = 0) -> Optional[str]:
-        """Extract image credit from a page using Crawl.ninja scraping.
-
-        Args:
-            url: URL of the page to scrape
-            idx: Current result index (for logging)
-            total: Total results (for logging)
-
-        Returns:
-            Image credit text or None if not found
-        """
-        try:
-            print(f"[Info.gouv.fr]   Scraping page with Crawl.ninja...")
-
-            headers = {
-                'X-API-Key': self.crawl_ninja_api_key,
-                'Content-Type': 'application/json'
-            }
-
-            payload = {
-                'url': url
-            }
-
-            print(f"[Info.gouv.fr]     Request: {self.CRAWL_NINJA_BASE_URL}")
-            print(f"[Info.gouv.fr]     Timeout: {Config.SCRAPING_TIMEOUT}s")
-
-            response = requests.post(
-                self.CRAWL_NINJA_BASE_URL,
-                headers=headers,
-                json=payload,
-                timeout=Config.SCRAPING_TIMEOUT  # Use dedicated scraping timeout
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            print(f"[Info.gouv.fr]     ✓ Scraping successful (status: {response.status_code})")
-
-            if data.get('success') and data.get('data'):
-                markdown = data['data'].get('markdown', '')
-
-                print(f"[Info.gouv.fr]     Scraped content length: {len(markdown)} chars")
-                print(f"[Info.gouv.fr]     First 300 chars of markdown:")
-                print(f"[Info.gouv.fr]       {markdown[:300]}")
-
-                # Look for common credit patterns in French
-                credit_patterns = [
-                    ('crédit', r'(?i)crédit[:\s]*([^\n\.]+)'),
-                    ('photo', r'(?i)photo[:\s]*([^\n\.]+)'),
-                    ('source', r'(?i)source[:\s]*([^\n\.]+)'),
-                    ('©', r'(?i)©[:\s]*([^\n\.]+)'),
-                    ('copyright', r'(?i)copyright[:\s]*([^\n\.]+)'),
-                ]
-
-                print(f"[Info.gouv.fr]     Attempting credit extraction with {len(credit_patterns)} patterns...")
-                for pattern_name, pattern in credit_patterns:
-                    match = re.search(pattern, markdown)
-                    if match:
-                        credit = match.group(1).strip()
-                        print(f"[Info.gouv.fr]     ✓ Credit found with pattern '{pattern_name}': {credit}")
-                        print(f"[Info.gouv.fr]     Checking for AFP...")
-                        is_afp = 'afp' in credit.lower()
-                        if is_afp:
-                            print(f"[Info.gouv.fr]     ⚠ AFP detected in credit!")
-                        else:
-                            print(f"[Info.gouv.fr]     ✓ No AFP detected")
-                        return credit
-                    else:
-                        print(f"[Info.gouv.fr]       Pattern '{pattern_name}' - no match")
-
-                print(f"[Info.gouv.fr]     ✗ No credit found with any pattern")
-            else:
-                print(f"[Info.gouv.fr]     ✗ Scraping failed or no data returned")
-
-            return None
-
-        except requests.exceptions.RequestException as e:
-            print(f"[Info.gouv.fr]   ✗ Error scraping page: {e}")
-            return None
-        except Exception as e:
-            print(f"[Info.gouv.fr]   ✗ Unexpected error scraping: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+    def _is_excluded_credit(self, credit: str) -> bool:
+        return self._is_afp_credit(credit)
 
     def _is_afp_credit(self, credit: str) -> bool:
         """Check if credit contains AFP (Agence France-Presse).
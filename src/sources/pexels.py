@@ -5,6 +5,7 @@ from typing import List
 from src.sources.base import ImageSource
 from src.models import ImageResult, LicenseType
 from src.config import Config
+from src.http_session import session as http_session
 
 
 class PexelsSource(ImageSource):
@@ -45,7 +46,7 @@ class PexelsSource(ImageSource):
                 'orientation': 'landscape'
             }
 
-            response = requests.get(
+            response = http_session.get(
                 f"{self.BASE_URL}/search",
                 headers=headers,
                 params=params,
@@ -5,6 +5,7 @@ from typing import List
 from src.sources.base import ImageSource
 from src.models import ImageResult, LicenseType
 from src.config import Config
+from src.http_session import session as http_session
 
 
 class PixabaySource(ImageSource):
@@ -43,7 +44,7 @@ class PixabaySource(ImageSource):
                 'safesearch': 'true'
             }
 
-            response = requests.get(
+            response = http_session.get(
                 self.BASE_URL,
                 params=params,
                 timeout=Config.REQUEST_TIMEOUT
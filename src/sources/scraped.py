@@ -0,0 +1,231 @@
+"""Shared base for sources that scrape result pages with Crawl.ninja to find image credits."""
+
+import concurrent.futures
+import re
+import requests
+from abc import abstractmethod
+from typing import Dict, Iterator, List, Optional, Tuple
+from src.sources.base import ImageSource
+from src.config import Config
+from src.cache import MemoryCache
+from src.http_session import session as http_session
+
+
+# Common copyrighted news/photo agencies
+COPYRIGHTED_AGENCIES = (
+    'ap',  # Associated Press
+    'reuters',
+    'getty',
+    'getty images',
+    'afp',  # Agence France-Presse
+    'upi',  # United Press International
+    'epa',  # European Pressphoto Agency
+    'shutterstock',
+    'alamy',
+    'corbis',
+)
+
+# Matched anywhere in a lowercased scraped credit
+COPYRIGHTED_SOURCES = re.compile('|'.join(map(re.escape, COPYRIGHTED_AGENCIES)))
+
+# Whole-word variant for search snippets, see ScrapedPageSource._preliminary_copyright_check()
+COPYRIGHTED_SNIPPET_SOURCES = re.compile(rf"\b(?:{'|'.join(map(re.escape, COPYRIGHTED_AGENCIES))})\b")
+
+
+def compile_credit_patterns(*keywords: str) -> List[Tuple[str, re.Pattern]]:
+    """Compile one credit-line pattern per keyword, kept in priority order.
+
+    Args:
+        keywords: Words that introduce a credit line (e.g. 'credit', '©')
+
+    Returns:
+        List of (keyword, compiled pattern) pairs; group 1 holds the credit text
+    """
+    return [(keyword, re.compile(rf'(?i){keyword}[:\s]*([^\n\.]+)')) for keyword in keywords]
+
+
+class ScrapedPageSource(ImageSource):
+    """Base class for sources that scrape each result page for its image credit.
+
+    Subclasses define CREDIT_PATTERNS, SNIPPET_CREDIT_KEYWORDS,
+    SNIPPET_EXCLUDED_SOURCES and _is_excluded_credit(); this class scrapes the pages, caches the credits
+    and checks search snippets before paying for a scrape.
+    """
+
+    CRAWL_NINJA_BASE_URL = "https://api.crawl.ninja/scrape/markdown"
+
+    # Result pages scraped for credits at the same time
+    SCRAPE_WORKERS = 8
+
+    # Credits extracted per page URL; a page's credit does not depend on the query
+    CREDIT_CACHE_SIZE = 4096
+    CREDIT_CACHE_TTL = 7 * 24 * 3600  # 7 days
+
+    # Credit patterns tried in priority order, see compile_credit_patterns()
+    CREDIT_PATTERNS: List[Tuple[str, re.Pattern]] = []
+
+    # Keywords of explicit credit lines looked for in search snippets before a page is scraped
+    SNIPPET_CREDIT_KEYWORDS: Tuple[str, ...] = ()
+
+    # Whole-word agency names that rule out a snippet credit (matched on lowercased text)
+    SNIPPET_EXCLUDED_SOURCES: Optional[re.Pattern] = None
+
+    # Name of what _is_excluded_credit() looks for, used in log messages
+    EXCLUDED_CREDIT_NAME = "copyrighted sources"
+
+    def __init__(self, ignira_api_key: str = None, crawl_ninja_api_key: str = None):
+        """Initialize with both API keys.
+
+        Args:
+            ignira_api_key: API key for Ignira search
+            crawl_ninja_api_key: API key for Crawl.ninja scraping
+        """
+        super().__init__(api_key=ignira_api_key)
+        self.ignira_api_key = ignira_api_key
+        self.crawl_ninja_api_key = crawl_ninja_api_key
+        self._credit_cache = MemoryCache(self.CREDIT_CACHE_SIZE, self.CREDIT_CACHE_TTL)
+
+    def is_available(self) -> bool:
+        """Check if both API keys are configured."""
+        return self.ignira_api_key is not None and self.crawl_ninja_api_key is not None
+
+    @abstractmethod
+    def _is_excluded_credit(self, credit: str) -> bool:
+        """Check if a credit rules the image out for this source's license."""
+        pass
+
+    def _scrape_credits(
+        self,
+        relevant_results: List[Tuple[int, Dict]],
+        total: int
+    ) -> Iterator[Tuple[int, Dict, Optional[str]]]:
+        """Extract the image credit of each result page concurrently.
+
+        Credits are yielded in search order. When the caller stops iterating
+        (e.g. once max_results is reached), scrapes that have not started yet
+        are cancelled.
+
+        Args:
+            relevant_results: (index, search result) pairs to scrape
+            total: Total results (for logging)
+
+        Yields:
+            (index, search result, credit or None) for each page
+        """
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.SCRAPE_WORKERS)
+        try:
+            credit_futures = [
+                executor.submit(self._extract_image_credit, search_result['url'], idx, total)
+                for idx, search_result in relevant_results
+            ]
+
+            for (idx, search_result), credit_future in zip(relevant_results, credit_futures):
+                yield idx, search_result, credit_future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _extract_image_credit(self, url: str, idx: int = 0, total: int = 0) -> Optional[str]:
+        """Extract image credit from a page using Crawl.ninja scraping.
+
+        Args:
+            url: URL of the page to scrape
+            idx: Current result index (for logging)
+            total: Total results (for logging)
+
+        Returns:
+            Image credit text or None if not found
+        """
+        name = self.get_source_name()
+
+        # Pages scraped earlier are answered from memory; '' records a page without a credit
+        cached = self._credit_cache.get(url)
+        if cached is not None:
+            print(f"[{name}]   ✓ Using cached credit for page: {cached or 'none'}")
+            return cached or None
+
+        try:
+            print(f"[{name}]   Scraping page with Crawl.ninja...")
+
+            headers = {
+                'X-API-Key': self.crawl_ninja_api_key,
+                'Content-Type': 'application/json'
+            }
+
+            payload = {
+                'url': url
+            }
+
+            print(f"[{name}]     Request: {self.CRAWL_NINJA_BASE_URL}")
+            print(f"[{name}]     Timeout: {Config.SCRAPING_TIMEOUT}s")
+
+            response = http_session.post(
+                self.CRAWL_NINJA_BASE_URL,
+                headers=headers,
+                json=payload,
+                timeout=Config.SCRAPING_TIMEOUT  # Use dedicated scraping timeout
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            print(f"[{name}]     ✓ Scraping successful (status: {response.status_code})")
+
+            if data.get('success') and data.get('data'):
+                markdown = data['data'].get('markdown', '')
+
+                print(f"[{name}]     Scraped content length: {len(markdown)} chars")
+                print(f"[{name}]     First 300 chars of markdown:")
+                print(f"[{name}]       {markdown[:300]}")
+
+                print(f"[{name}]     Attempting credit extraction with {len(self.CREDIT_PATTERNS)} patterns...")
+                for pattern_name, pattern in self.CREDIT_PATTERNS:
+                    match = pattern.search(markdown)
+                    if match:
+                        credit = match.group(1).strip()
+                        print(f"[{name}]     ✓ Credit found with pattern '{pattern_name}': {credit}")
+                        print(f"[{name}]     Checking for {self.EXCLUDED_CREDIT_NAME}...")
+                        if self._is_excluded_credit(credit):
+                            print(f"[{name}]     ⚠ Excluded source detected in credit ({self.EXCLUDED_CREDIT_NAME})!")
+                        else:
+                            print(f"[{name}]     ✓ No {self.EXCLUDED_CREDIT_NAME} detected")
+                        self._credit_cache.set(url, credit)
+                        return credit
+                    else:
+                        print(f"[{name}]       Pattern '{pattern_name}' - no match")
+
+                print(f"[{name}]     ✗ No credit found with any pattern")
+                self._credit_cache.set(url, '')
+            else:
+                print(f"[{name}]     ✗ Scraping failed or no data returned")
+
+            return None
+
+        except requests.exceptions.RequestException as e:
+            print(f"[{name}]   ✗ Error scraping page: {e}")
+            return None
+        except Exception as e:
+            print(f"[{name}]   ✗ Unexpected error scraping: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
+
+    def _preliminary_copyright_check(self, search_result: Dict) -> bool:
+        """Check a search snippet for an explicit credit line that rules the image out.
+
+        Only explicit credit lines are checked, and agencies must appear as whole
+        words: snippet text runs on past the credit, so the substring match used
+        on scraped credits would reject lines like "credit support to Japan".
+
+        Args:
+            search_result: Ignira search result with 'content' and 'title'
+
+        Returns:
+            True if the snippet already credits an excluded source
+        """
+        snippet = f"{search_result.get('content', '')}\n{search_result.get('title', '')}"
+        for keyword, pattern in self.CREDIT_PATTERNS:
+            if keyword not in self.SNIPPET_CREDIT_KEYWORDS:
+                continue
+            match = pattern.search(snippet)
+            if match:
+                return self.SNIPPET_EXCLUDED_SOURCES.search(match.group(1).lower()) is not None
+        return False
@@ -5,6 +5,7 @@ from typing import List
 from src.sources.base import ImageSource
 from src.models import ImageResult, LicenseType
 from src.config import Config
+from src.http_session import session as http_session
 
 
 class UnsplashSource(ImageSource):
@@ -45,7 +46,7 @@ class UnsplashSource(ImageSource):
                 'orientation': 'landscape'
             }
 
-            response = requests.get(
+            response = http_session.get(
                 f"{self.BASE_URL}/search/photos",
                 headers=headers,
                 params=params,
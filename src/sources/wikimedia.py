@@ -5,6 +5,7 @@ from typing import List
 from src.sources.base import ImageSource
 from src.models import ImageResult, LicenseType
 from src.config import Config
+from src.http_session import session as http_session
 
 
 class WikimediaSource(ImageSource):
@@ -45,7 +46,7 @@ class WikimediaSource(ImageSource):
                 'User-Agent': Config.USER_AGENT
             }
 
-            response = requests.get(
+            response = http_session.get(
                 self.BASE_URL,
                 params=search_params,
                 headers=headers,
@@ -8,7 +8,54 @@ IMPORTANT: This module does NOT import TensorFlow itself to avoid
 crashes during initialization. It only sets environment variables.
 """
 
+import math
 import os
+from typing import Optional
+
+# CPU quota files for cgroup v2 ("<quota> <period>" or "max <period>") and v1
+CGROUP_V2_CPU_MAX = '/sys/fs/cgroup/cpu.max'
+CGROUP_V1_CPU_QUOTA = '/sys/fs/cgroup/cpu/cpu.cfs_quota_us'
+CGROUP_V1_CPU_PERIOD = '/sys/fs/cgroup/cpu/cpu.cfs_period_us'
+
+
+def _cgroup_cpu_limit() -> Optional[int]:
+    """Return the CPU count allowed by the cgroup CFS quota (e.g. docker --cpus).
+
+    Returns:
+        Quota rounded up to whole CPUs, or None if no quota is set or readable
+    """
+    try:
+        with open(CGROUP_V2_CPU_MAX) as f:
+            quota, period = f.read().split()[:2]
+        if quota == 'max':
+            return None
+    except (OSError, ValueError):
+        try:
+            with open(CGROUP_V1_CPU_QUOTA) as f:
+                quota = f.read().strip()
+            with open(CGROUP_V1_CPU_PERIOD) as f:
+                period = f.read().strip()
+        except OSError:
+            return None
+
+    try:
+        quota, period = int(quota), int(period)
+    except ValueError:
+        return None
+    if quota <= 0 or period <= 0:  # v1 reports -1 when unlimited
+        return None
+    return max(1, math.ceil(quota / period))
+
+
+def available_cpus() -> int:
+    """Count the CPUs this process may use: its CPU affinity capped by any cgroup quota."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS/Windows
+        cpus = os.cpu_count() or 1
+
+    limit = _cgroup_cpu_limit()
+    return min(cpus, limit) if limit else cpus
 
 # Set comprehensive environment variables to force CPU-only mode
 # These MUST be set before TensorFlow is imported anywhere in the application
@@ -35,6 +82,15 @@ os.environ['TF_DISABLE_SEGMENT_REDUCTION_OP_DETERMINISM_EXCEPTIONS'] = '1'
 os.environ['NVIDIA_VISIBLE_DEVICES'] = ''
 os.environ['NVIDIA_DRIVER_CAPABILITIES'] = ''
 
+# Size TensorFlow's thread pools to the CPUs this process may actually run on:
+# the affinity mask covers cpusets, the cgroup quota covers limits such as
+# docker --cpus, and neither is reflected in the host's logical CPU count.
+# setdefault keeps any value configured for the deployment.
+_available_cpus = available_cpus()
+os.environ.setdefault('TF_NUM_INTRAOP_THREADS', str(_available_cpus))
+os.environ.setdefault('TF_NUM_INTEROP_THREADS', '2')
+os.environ.setdefault('OMP_NUM_THREADS', str(_available_cpus))
+
 print("✓ CPU-only mode enforced (environment variables set)")
 
 def configure_tensorflow_cpu():
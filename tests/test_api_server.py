@@ -0,0 +1,56 @@
+"""Tests for the REST API server."""
+
+import pytest
+import api_server
+
+
+@pytest.fixture
+def client():
+    """Create a Flask test client."""
+    return api_server.app.test_client()
+
+
+@pytest.fixture(autouse=True)
+def fake_finder(monkeypatch):
+    """Keep tests away from the real finder and its on-disk cache."""
+    monkeypatch.setattr(api_server, 'finder', None)
+    monkeypatch.setattr(api_server, 'LicensedImageFinder', lambda: object())
+
+
+def test_health_reports_warmup(client):
+    """Test that /health returns 503 until the warmup thread has built the finder."""
+    response = client.get('/health')
+    assert response.status_code == 503
+    assert response.get_json()['status'] == 'starting'
+
+    api_server.start_warmup().join()
+    response = client.get('/health')
+    assert response.status_code == 200
+    assert response.get_json()['status'] == 'healthy'
+
+
+def test_search_rejects_invalid_input(client, monkeypatch):
+    """Test that malformed search requests are rejected before the finder is used."""
+    def fail():
+        raise AssertionError("get_finder() should not be called")
+
+    monkeypatch.setattr(api_server, 'get_finder', fail)
+
+    response = client.post('/api/search', data='not json', content_type='application/json')
+    assert response.status_code == 400
+
+    response = client.post('/api/search', json=['Albert Einstein'])
+    assert response.status_code == 400
+
+    response = client.post('/api/search', json={'query': 'Albert Einstein', 'max_results': 'many'})
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'max_results must be an integer'
+
+
+def test_search_rejects_oversized_body(client):
+    """Test that request bodies above MAX_CONTENT_LENGTH get a 413."""
+    body = '{"query": "' + 'a' * api_server.app.config['MAX_CONTENT_LENGTH'] + '"}'
+    response = client.post('/api/search', data=body, content_type='application/json')
+
+    assert response.status_code == 413
+    assert response.get_json()['success'] is False
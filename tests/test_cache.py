@@ -0,0 +1,329 @@
+"""Tests for the SQLite cache."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+
+import pytest
+from src.cache import ImageCache
+
+
+@pytest.fixture
+def make_cache(tmp_path):
+    """Create caches backed by a temporary database and close them after the test."""
+    caches = []
+
+    def make(**kwargs):
+        kwargs.setdefault('db_path', str(tmp_path / "cache.db"))
+        caches.append(ImageCache(**kwargs))
+        return caches[-1]
+
+    yield make
+    for cache in caches:
+        cache.close()
+
+
+@pytest.fixture
+def cache(make_cache):
+    """Create a cache backed by a temporary database."""
+    return make_cache()
+
+
+def test_cache_set_and_get(cache):
+    """Test storing and retrieving search results."""
+    results = [{'image_url': 'https://example.com/image.jpg', 'source': 'Test Source'}]
+    cache.set("Albert Einstein", "person", "Test Source", results)
+
+    assert cache.get("Albert Einstein", "person", "Test Source") == results
+    # Keys are case-insensitive
+    assert cache.get("albert einstein", "PERSON", "test source") == results
+    assert cache.get("Marie Curie", "person", "Test Source") is None
+
+
+def test_cache_expired_entries(make_cache):
+    """Test that expired entries are not returned and can be cleared."""
+    cache = make_cache(ttl_days=-1)
+    cache.set("Albert Einstein", "person", "Test Source", [{'image_url': 'x'}])
+
+    assert cache.get("Albert Einstein", "person", "Test Source") is None
+    assert cache.clear_expired() == 1
+
+
+def test_large_expiry_sweep_reclaims_pages(make_cache):
+    """Test that sweeping many expired rows returns the freed pages to the OS."""
+    cache = make_cache(ttl_days=-1)
+    cache.set_face_detection_bulk([
+        (f"https://example.com/{i}.jpg", True, 1)
+        for i in range(ImageCache.VACUUM_AFTER_DELETES * 2)
+    ])
+
+    assert cache.clear_expired() == ImageCache.VACUUM_AFTER_DELETES * 2
+    with cache._conn() as conn:
+        assert conn.execute('PRAGMA freelist_count').fetchone()[0] == 0
+
+
+def test_face_and_gender_cache(cache):
+    """Test face detection and gender classification caching."""
+    url = "https://example.com/face.jpg"
+
+    assert cache.get_face_detection(url) is None
+    cache.set_face_detection(url, True, 2)
+    assert cache.get_face_detection(url) == (True, 2)
+
+    assert cache.get_gender_classification(url) is None
+    cache.set_gender_classification(url, 'female')
+    assert cache.get_gender_classification(url) == 'female'
+
+
+def test_cache_concurrent_access(cache):
+    """Test that pooled connections can be used from many threads."""
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(20):
+                cache.set(f"query {n}", "person", "Test Source", [{'i': i}])
+                assert cache.get(f"query {n}", "person", "Test Source") == [{'i': i}]
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(ImageCache.POOL_SIZE * 2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert cache.get_stats()['active_entries'] == ImageCache.POOL_SIZE * 2
+
+
+def test_cache_uses_wal_journal(make_cache, tmp_path):
+    """Test that the cache database is switched to WAL mode."""
+    db_path = str(tmp_path / "cache.db")
+    make_cache(db_path=db_path)
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+    conn.close()
+
+
+def test_pooled_connections_use_tuned_pragmas(cache):
+    """Test that every pooled connection gets the performance pragmas."""
+    with cache._conn() as conn:
+        assert conn.execute('PRAGMA synchronous').fetchone()[0] == 1  # NORMAL
+        assert conn.execute('PRAGMA temp_store').fetchone()[0] == 2  # MEMORY
+        assert conn.execute('PRAGMA busy_timeout').fetchone()[0] == 5000
+        assert conn.execute('PRAGMA cache_size').fetchone()[0] < 0
+
+
+def test_bulk_face_and_gender_cache(cache):
+    """Test caching several face and gender results at once."""
+    cache.set_face_detection_bulk([
+        ("https://example.com/a.jpg", True, 1),
+        ("https://example.com/b.jpg", False, 0),
+    ])
+    cache.set_gender_classification_bulk([
+        ("https://example.com/a.jpg", 'male'),
+        ("https://example.com/b.jpg", 'female'),
+    ])
+
+    assert cache.get_face_detection("https://example.com/a.jpg") == (True, 1)
+    assert cache.get_face_detection("https://example.com/b.jpg") == (False, 0)
+    assert cache.get_gender_classification("https://example.com/b.jpg") == 'female'
+
+    urls = ["https://example.com/a.jpg", "https://example.com/c.jpg", "https://example.com/b.jpg"]
+    assert cache.get_face_detection_bulk(urls) == {
+        "https://example.com/a.jpg": (True, 1),
+        "https://example.com/b.jpg": (False, 0),
+    }
+    assert cache.get_gender_classification_bulk(urls) == {
+        "https://example.com/a.jpg": 'male',
+        "https://example.com/b.jpg": 'female',
+    }
+
+
+def test_bulk_lookup_larger_than_chunk(cache):
+    """Test bulk lookups with more URLs than fit in a single IN (...) query."""
+    urls = [f"https://example.com/{i}.jpg" for i in range(ImageCache.BULK_LOOKUP_CHUNK * 2 + 1)]
+    cache.set_gender_classification_bulk([(url, 'male') for url in urls[::2]])
+
+    assert cache.get_gender_classification_bulk(urls) == {url: 'male' for url in urls[::2]}
+
+
+def test_legacy_entries_are_migrated(make_cache, tmp_path):
+    """Test that entries cached by older versions (MD5 keys, plain JSON) are still found."""
+    db_path = str(tmp_path / "cache.db")
+    make_cache(db_path=db_path).close()
+
+    legacy_key = hashlib.md5(b"albert einstein:person:test source").hexdigest()
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        'INSERT INTO image_cache VALUES (?, ?, ?, ?, ?, ?, ?, 0)',
+        (legacy_key, "Albert Einstein", "person", "Test Source", '[{"image_url": "x"}]',
+         int(time.time()), int(time.time()) + 3600)
+    )
+    conn.execute('PRAGMA user_version = 0')
+    conn.commit()
+    conn.close()
+
+    cache = make_cache(db_path=db_path)
+    assert cache.get("Albert Einstein", "person", "Test Source") == [{'image_url': 'x'}]
+
+
+def test_url_keyed_tables_are_migrated(make_cache, tmp_path):
+    """Test that face/gender results cached under the old URL-keyed schema are still found."""
+    db_path = str(tmp_path / "cache.db")
+    conn = sqlite3.connect(db_path)
+    conn.executescript('''
+        CREATE TABLE face_detection_cache (image_url TEXT PRIMARY KEY, has_face INTEGER NOT NULL,
+            face_count INTEGER NOT NULL, detected_at INTEGER NOT NULL, expires_at INTEGER NOT NULL);
+        CREATE TABLE gender_classification_cache (image_url TEXT PRIMARY KEY, gender TEXT NOT NULL,
+            classified_at INTEGER NOT NULL, expires_at INTEGER NOT NULL);
+        CREATE INDEX idx_face_expires ON face_detection_cache(expires_at);
+        CREATE INDEX idx_gender_expires ON gender_classification_cache(expires_at);
+        PRAGMA user_version = 3;
+    ''')
+    expires_at = int(time.time()) + 3600
+    conn.execute('INSERT INTO face_detection_cache VALUES (?, 1, 2, 0, ?)', ("https://example.com/a.jpg", expires_at))
+    conn.execute('INSERT INTO gender_classification_cache VALUES (?, ?, 0, ?)', ("https://example.com/a.jpg", 'female', expires_at))
+    conn.commit()
+    conn.close()
+
+    cache = make_cache(db_path=db_path)
+    assert cache.get_face_detection("https://example.com/a.jpg") == (True, 2)
+    assert cache.get_gender_classification("https://example.com/a.jpg") == 'female'
+
+
+def test_memory_layer_invalidated_on_write(cache):
+    """Test that hot entries kept in memory are refreshed by set() and clear_all()."""
+    cache.set("Albert Einstein", "person", "Test Source", [{'image_url': 'old'}])
+    assert cache.get("Albert Einstein", "person", "Test Source") == [{'image_url': 'old'}]
+
+    cache.set("Albert Einstein", "person", "Test Source", [{'image_url': 'new'}])
+    assert cache.get("Albert Einstein", "person", "Test Source") == [{'image_url': 'new'}]
+
+    cache.clear_all()
+    assert cache.get("Albert Einstein", "person", "Test Source") is None
+
+
+def test_gender_memory_layer(cache):
+    """Test that repeat gender lookups are answered from memory until the cache is cleared."""
+    url = "https://example.com/face.jpg"
+    cache.set_gender_classification(url, 'male')
+
+    with cache._conn() as conn:
+        conn.execute('DELETE FROM gender_classification_cache')
+    assert cache.get_gender_classification(url) == 'male'
+
+    cache.clear_all()
+    assert cache.get_gender_classification(url) is None
+
+
+def test_query_gender_cache(cache):
+    """Test caching the expected gender per person query, ignoring case, accents and spacing."""
+    assert cache.get_query_gender("Marie Curie") is None
+    cache.set_query_gender("Marie Curie", 'female')
+    cache.set_query_gender("José Martí", 'male')
+
+    assert cache.get_query_gender("  marie   CURIE ") == 'female'
+    assert cache.get_query_gender("Jose Marti") == 'male'
+    cache.clear_all()
+    assert cache.get_query_gender("Marie Curie") is None
+
+
+def test_set_many(cache):
+    """Test caching results for several sources at once."""
+    cache.set_many([
+        ("Albert Einstein", "person", "Source A", [{'image_url': 'a'}]),
+        ("Albert Einstein", "person", "Source B", [{'image_url': 'b'}]),
+    ])
+
+    assert cache.get("Albert Einstein", "person", "Source A") == [{'image_url': 'a'}]
+    assert cache.get("Albert Einstein", "person", "Source B") == [{'image_url': 'b'}]
+
+
+def test_get_many(cache):
+    """Test looking up several sources at once."""
+    cache.set("Albert Einstein", "person", "Source A", [{'image_url': 'a'}])
+    cache.set("Albert Einstein", "person", "Source B", [{'image_url': 'b'}])
+
+    results = cache.get_many("Albert Einstein", "person", ["Source A", "Source B", "Source C"])
+
+    assert results == {
+        "Source A": [{'image_url': 'a'}],
+        "Source B": [{'image_url': 'b'}],
+        "Source C": None,
+    }
+    assert cache.get_stats()['total_hits'] == 2
+
+
+def test_hits_flushed_at_threshold(cache, monkeypatch):
+    """Test that buffered hits are written once enough entries have pending hits."""
+    monkeypatch.setattr(ImageCache, 'HIT_FLUSH_THRESHOLD', 2)
+    cache.set("Albert Einstein", "person", "Source A", [{'image_url': 'a'}])
+    cache.set("Albert Einstein", "person", "Source B", [{'image_url': 'b'}])
+
+    cache.get("Albert Einstein", "person", "Source A")
+    assert len(cache._pending_hits) == 1
+    cache.get("Albert Einstein", "person", "Source B")
+    assert len(cache._pending_hits) == 0
+
+
+def test_search_cache(cache):
+    """Test substring search over cached queries, including after overwrites and deletes."""
+    cache.set("Albert Einstein", "person", "Source A", [{'image_url': 'a'}])
+    cache.set("Albert Einstein", "person", "Source A", [{'image_url': 'b'}])
+    cache.set("Marie Curie", "person", "Source A", [{'image_url': 'c'}])
+
+    matches = cache.search_cache("einst")
+    assert [m['query'] for m in matches] == ["Albert Einstein"]
+    assert [m['query'] for m in cache.search_cache("ie")] == ["Marie Curie"]
+
+    cache.clear_all()
+    assert cache.search_cache("einst") == []
+
+
+def test_close_flushes_hits(tmp_path):
+    """Test that close() writes buffered hit counts before closing connections."""
+    db_path = str(tmp_path / "cache.db")
+    cache = ImageCache(db_path=db_path)
+    cache.set("Albert Einstein", "person", "Test Source", [{'image_url': 'x'}])
+    cache.get("Albert Einstein", "person", "Test Source")
+    cache.close()
+    cache.close()  # closing twice is harmless
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute('SELECT hit_count FROM image_cache').fetchone()[0] == 1
+    conn.close()
+
+
+def test_expiry_sweep_keeps_memory_layer(cache):
+    """Test that sweeping expired rows leaves unexpired hot entries in memory."""
+    cache.set("Albert Einstein", "person", "Test Source", [{'image_url': 'x'}])
+    cache.set_gender_classification("https://example.com/face.jpg", 'male')
+    cache.get("Albert Einstein", "person", "Test Source")
+
+    cache.clear_expired()
+    with cache._conn() as conn:
+        conn.execute('DELETE FROM image_cache')
+        conn.execute('DELETE FROM gender_classification_cache')
+
+    assert cache.get("Albert Einstein", "person", "Test Source") == [{'image_url': 'x'}]
+    assert cache.get_gender_classification("https://example.com/face.jpg") == 'male'
+
+
+def test_dropped_cache_is_released(tmp_path):
+    """Test that maintenance threads and the exit hook do not keep an unreferenced cache alive."""
+    import gc
+    import weakref
+
+    cache = ImageCache(db_path=str(tmp_path / "cache.db"))
+    cache_ref = weakref.ref(cache)
+    stop_event = cache._stop_event
+
+    del cache
+    gc.collect()
+
+    assert cache_ref() is None
+    assert stop_event.is_set()
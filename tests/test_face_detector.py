@@ -47,3 +47,95 @@ def test_face_detection_with_invalid_url():
     # Should return False and 0 for invalid URLs
     assert has_face is False
     assert face_count == 0
+
+
+def test_batch_face_detection_handles_failures(monkeypatch):
+    """Test that a batch keeps going when some downloads fail."""
+    from io import BytesIO
+    from PIL import Image
+    import src.face_detector
+
+    detector = FaceDetector()
+    blank = BytesIO()
+    Image.new('RGB', (100, 100)).save(blank, format='PNG')
+
+    def fake_download(image_url):
+        if image_url == "https://example.com/broken.jpg":
+            return b'not an image'
+        return blank.getvalue()
+
+    monkeypatch.setattr(src.face_detector, 'download_image', fake_download)
+
+    detections = detector.detect_faces_from_urls([
+        "https://example.com/blank.jpg",
+        "https://example.com/broken.jpg",
+        "https://example.com/blank.jpg",
+    ])
+
+    assert detections == {
+        "https://example.com/blank.jpg": (False, 0),
+        "https://example.com/broken.jpg": (False, 0),
+    }
+
+
+def test_large_images_are_downscaled_before_detection(monkeypatch):
+    """Test that detection runs on an image no larger than MAX_DETECTION_DIMENSION."""
+    import numpy as np
+    import face_recognition
+
+    shapes = []
+
+    def fake_face_locations(img_array, model):
+        shapes.append(img_array.shape)
+        return []
+
+    monkeypatch.setattr(face_recognition, 'face_locations', fake_face_locations)
+
+    FaceDetector()._count_faces(np.zeros((3000, 4000, 3), dtype=np.uint8))
+
+    assert shapes == [(768, 1024, 3)]
+
+
+def test_cached_face_detection_skips_download(tmp_path, monkeypatch):
+    """Test that cached results are returned without downloading the image again."""
+    from src.cache import ImageCache
+
+    cache = ImageCache(db_path=str(tmp_path / "cache.db"))
+    detector = FaceDetector(cache=cache)
+    cache.set_face_detection("https://example.com/face.jpg", True, 1)
+
+    def fail(image_url):
+        raise AssertionError("image should not be downloaded")
+
+    monkeypatch.setattr(detector, '_download_image', fail)
+    monkeypatch.setattr('src.face_detector.download_image', fail)
+
+    assert detector.detect_faces_from_url("https://example.com/face.jpg") == (True, 1)
+    assert detector.detect_faces_from_urls(["https://example.com/face.jpg"]) == {
+        "https://example.com/face.jpg": (True, 1)
+    }
+    cache.close()
+
+
+def test_batch_face_detection_survives_cache_errors(monkeypatch):
+    """Test that a failing cache does not fail the batch."""
+    import sqlite3
+    from io import BytesIO
+    from PIL import Image
+    import src.face_detector
+
+    class LockedCache:
+        def get_face_detection_bulk(self, image_urls):
+            raise sqlite3.OperationalError("database is locked")
+
+        def set_face_detection_bulk(self, results):
+            raise sqlite3.OperationalError("database is locked")
+
+    detector = FaceDetector(cache=LockedCache())
+    blank = BytesIO()
+    Image.new('RGB', (100, 100)).save(blank, format='PNG')
+    monkeypatch.setattr(src.face_detector, 'download_image', lambda image_url: blank.getvalue())
+
+    assert detector.detect_faces_from_urls(["https://example.com/blank.jpg"]) == {
+        "https://example.com/blank.jpg": (False, 0)
+    }
@@ -0,0 +1,29 @@
+"""Tests for LLM gender detection."""
+
+import sqlite3
+import src.gender_detector
+from src.gender_detector import GenderDetector
+
+
+class FakeResponse:
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {'choices': [{'message': {'content': 'Female'}}]}
+
+
+def test_gender_detection_survives_cache_errors(monkeypatch):
+    """Test that a failing cache neither fails nor changes the detection."""
+    class LockedCache:
+        def get_query_gender(self, query):
+            raise sqlite3.OperationalError("database is locked")
+
+        def set_query_gender(self, query, gender):
+            raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(src.gender_detector.http_session, 'post', lambda *args, **kwargs: FakeResponse())
+    detector = GenderDetector(cache=LockedCache())
+    detector.enabled = True
+
+    assert detector.detect_gender("Marie Curie") == 'female'
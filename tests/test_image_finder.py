@@ -63,6 +63,68 @@ def test_quality_score_calculation():
     assert result1.quality_score > result2.quality_score
 
 
+def test_relevance_filter():
+    """Test that results must mention the significant query words."""
+    finder = LicensedImageFinder()
+
+    def make_result(title, description=None):
+        return ImageResult(
+            image_url="https://example.com/image.jpg",
+            thumbnail_url="https://example.com/thumb.jpg",
+            source="Test Source",
+            license_type=LicenseType.CC0.value,
+            license_url="https://example.com",
+            title=title,
+            description=description
+        )
+
+    both_words = make_result("Albert Einstein in 1921")
+    split_fields = make_result("Portrait of Albert", "Physicist Einstein at his desk")
+    one_word = make_result("Albert Camus")
+
+    results = finder._filter_by_relevance([both_words, split_fields, one_word], "Albert Einstein")
+
+    assert results == [both_words, split_fields]
+
+    # A repeated query word counts every time it appears in the query
+    repeated = make_result("Jean-Paul Jean portrait")
+    assert finder._filter_by_relevance([repeated], "jean jean sartre") == [repeated]
+
+
+def test_find_images_survives_cache_errors(monkeypatch):
+    """Test that a failing cache falls back to fetching every source."""
+    import sqlite3
+    from src.sources.base import ImageSource
+
+    class FakeSource(ImageSource):
+        def search(self, query, max_results=10):
+            return [ImageResult(
+                image_url="https://example.com/einstein.jpg",
+                thumbnail_url="https://example.com/einstein_thumb.jpg",
+                source="Fake Source",
+                license_type=LicenseType.CC0.value,
+                license_url="https://example.com",
+                title="Albert Einstein"
+            )]
+
+        def get_source_name(self):
+            return "Fake Source"
+
+    def locked(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    finder = LicensedImageFinder()
+    finder.sources = [FakeSource()]
+    finder.face_detector = None
+    monkeypatch.setattr(finder.cache, 'get_many', locked)
+    monkeypatch.setattr(finder.cache, 'set_many', locked)
+
+    results = finder.find_images("Albert Einstein", entity_type="thing", require_face=False)
+
+    assert [r['image_url'] for r in results] == ["https://example.com/einstein.jpg"]
+    finder.close()
+
+
 def test_find_images_basic():
     """Test basic image finding (integration test)."""
     finder = LicensedImageFinder()
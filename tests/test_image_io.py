@@ -0,0 +1,77 @@
+"""Tests for image decoding helpers."""
+
+import threading
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+from functools import partial
+from io import BytesIO
+
+import pytest
+from PIL import Image
+from src.config import Config
+from src.image_io import decode_image, download_image, downscale_image
+
+
+def _encode(fmt):
+    """Encode a small pure-red image in the given format."""
+    buffer = BytesIO()
+    Image.new('RGB', (8, 6), (255, 0, 0)).save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize('fmt', ['PNG', 'JPEG', 'GIF'])
+def test_decode_image_returns_bgr(fmt):
+    """Test that images decode to height x width x 3 BGR arrays, including formats OpenCV can't read."""
+    img = decode_image(_encode(fmt))
+
+    assert img.shape == (6, 8, 3)
+    blue, green, red = img[0, 0]
+    assert red > 200 and blue < 50 and green < 50
+
+
+def test_decode_image_reduced_scale():
+    """Test that large JPEGs are decoded at a reduced scale that still covers max_dimension."""
+    buffer = BytesIO()
+    Image.new('RGB', (4000, 3000), (255, 0, 0)).save(buffer, format='JPEG')
+
+    assert decode_image(buffer.getvalue(), max_dimension=1024).shape == (1500, 2000, 3)
+    assert decode_image(buffer.getvalue(), max_dimension=4000).shape == (3000, 4000, 3)
+    # Formats without DCT scaling are decoded at full size
+    assert decode_image(_encode('PNG'), max_dimension=2).shape == (6, 8, 3)
+
+
+def test_downscale_image():
+    """Test that only images larger than max_dimension are shrunk, keeping the aspect ratio."""
+    import numpy as np
+
+    assert downscale_image(np.zeros((3000, 4000, 3), dtype=np.uint8), 640).shape == (480, 640, 3)
+    small = np.zeros((300, 400, 3), dtype=np.uint8)
+    assert downscale_image(small, 640) is small
+
+
+def test_decode_image_rejects_garbage():
+    """Test that non-image data raises an error."""
+    with pytest.raises(Exception):
+        decode_image(b'not an image')
+
+
+@pytest.fixture
+def image_server(tmp_path):
+    """Serve files from a temporary directory over local HTTP."""
+    handler = partial(SimpleHTTPRequestHandler, directory=str(tmp_path))
+    server = HTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield tmp_path, f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_download_image(image_server, monkeypatch):
+    """Test downloading an image and rejecting files above MAX_IMAGE_BYTES."""
+    directory, base_url = image_server
+    (directory / "small.png").write_bytes(_encode('PNG'))
+    (directory / "large.bin").write_bytes(b'\0' * 2048)
+    monkeypatch.setattr(Config, 'MAX_IMAGE_BYTES', 1024)
+
+    assert decode_image(download_image(f"{base_url}/small.png")).shape == (6, 8, 3)
+    with pytest.raises(ValueError):
+        download_image(f"{base_url}/large.bin")
@@ -5,6 +5,7 @@ from src.sources.wikimedia import WikimediaSource
 from src.sources.unsplash import UnsplashSource
 from src.sources.pexels import PexelsSource
 from src.sources.pixabay import PixabaySource
+from src.sources.europa import EuropaSource
 
 
 def test_wikimedia_source_initialization():
@@ -68,3 +69,113 @@ def test_wikimedia_license_parsing():
     assert "CC BY" in source._parse_license("CC-BY-4.0")
     assert "CC BY-SA" in source._parse_license("CC-BY-SA-3.0")
     assert "Public Domain" in source._parse_license("Public Domain")
+
+
+def test_europa_credit_extraction_patterns():
+    """Test credit pattern priority and copyrighted-agency detection."""
+    source = EuropaSource()
+    markdown = "Image source: European Commission\nCredit: Reuters/John Smith"
+
+    credit = next(
+        match.group(1).strip()
+        for _, pattern in source.CREDIT_PATTERNS
+        for match in [pattern.search(markdown)] if match
+    )
+
+    # 'credit' outranks 'image' even though it appears later in the page
+    assert credit == "Reuters/John Smith"
+    assert source._is_copyrighted(credit) is True
+    assert source._is_copyrighted("European Union, 2024") is False
+
+
+def test_europa_search_scrapes_credits_concurrently(monkeypatch):
+    """Test that concurrent credit scraping keeps search order and stops at max_results."""
+    import time
+
+    source = EuropaSource(ignira_api_key="test_key", crawl_ninja_api_key="test_key")
+    search_results = [
+        {'url': f"https://commission.europa.eu/page{i}", 'title': f"Budget {i}", 'thumbnail': f"https://x/{i}.jpg"}
+        for i in range(4)
+    ]
+    credits = {0: "EU/John Doe", 1: "Reuters", 2: "EU/Jane Roe", 3: "EU/Max Mustermann"}
+
+    def fake_credit(url, idx=0, total=0):
+        i = int(url[-1])
+        time.sleep(0.05 * (4 - i))  # earlier pages finish last
+        return credits[i]
+
+    monkeypatch.setattr(source, '_search_images', lambda query, limit: search_results)
+    monkeypatch.setattr(source, '_extract_image_credit', fake_credit)
+
+    results = source.search("budget", max_results=2)
+
+    assert [result.author for result in results] == ["EU/John Doe", "EU/Jane Roe"]
+
+
+def test_europa_credit_cached_per_page(monkeypatch):
+    """Test that each page is scraped once, including pages without a credit, but failures are retried."""
+    import requests
+    from src.sources import europa
+
+    source = EuropaSource(ignira_api_key="test_key", crawl_ninja_api_key="test_key")
+    pages = {
+        "https://commission.europa.eu/a": "Credit: EU/John Doe",
+        "https://commission.europa.eu/b": "No attribution on this page",
+    }
+    calls = []
+
+    class FakeResponse:
+        status_code = 200
+
+        def __init__(self, markdown):
+            self.markdown = markdown
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {'success': True, 'data': {'markdown': self.markdown}}
+
+    def fake_post(url, headers=None, json=None, timeout=None):
+        calls.append(json['url'])
+        if json['url'] not in pages:
+            raise requests.exceptions.ConnectionError("unreachable")
+        return FakeResponse(pages[json['url']])
+
+    monkeypatch.setattr(europa.http_session, 'post', fake_post)
+
+    for _ in range(2):
+        assert source._extract_image_credit("https://commission.europa.eu/a") == "EU/John Doe"
+        assert source._extract_image_credit("https://commission.europa.eu/b") is None
+        assert source._extract_image_credit("https://commission.europa.eu/down") is None
+
+    assert calls == [
+        "https://commission.europa.eu/a",
+        "https://commission.europa.eu/b",
+        "https://commission.europa.eu/down",
+        "https://commission.europa.eu/down",
+    ]
+
+
+def test_europa_snippet_credit_skips_scrape(monkeypatch):
+    """Test that results whose snippet credits an agency are dropped without scraping the page."""
+    source = EuropaSource(ignira_api_key="test_key", crawl_ninja_api_key="test_key")
+    search_results = [
+        {'url': "https://commission.europa.eu/a", 'title': "Budget", 'content': "Budget talks. Credit: Reuters/John Smith"},
+        {'url': "https://commission.europa.eu/b", 'title': "Budget", 'content': "A map of the budget, happy photographers"},
+        {'url': "https://commission.europa.eu/c", 'title': "Budget", 'content': "Budget and credit support to Japan"},
+    ]
+    scraped = []
+
+    def fake_credit(url, idx=0, total=0):
+        scraped.append(url)
+        return None
+
+    monkeypatch.setattr(source, '_search_images', lambda query, limit: search_results)
+    monkeypatch.setattr(source, '_extract_image_credit', fake_credit)
+
+    results = source.search("budget", max_results=5)
+
+    # Agency names must be whole words in a credit line ('ap' in 'map' or 'Japan' does not count)
+    assert scraped == ["https://commission.europa.eu/b", "https://commission.europa.eu/c"]
+    assert [r.page_url for r in results] == ["https://commission.europa.eu/b", "https://commission.europa.eu/c"]
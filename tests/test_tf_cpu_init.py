@@ -0,0 +1,32 @@
+"""Tests for the TensorFlow CPU thread configuration."""
+
+from src import tf_cpu_init
+
+
+def test_cgroup_cpu_limit(tmp_path, monkeypatch):
+    """Test reading the CFS quota from cgroup v2 and v1 files."""
+    cpu_max = tmp_path / "cpu.max"
+    quota = tmp_path / "cpu.cfs_quota_us"
+    period = tmp_path / "cpu.cfs_period_us"
+    monkeypatch.setattr(tf_cpu_init, 'CGROUP_V2_CPU_MAX', str(cpu_max))
+    monkeypatch.setattr(tf_cpu_init, 'CGROUP_V1_CPU_QUOTA', str(quota))
+    monkeypatch.setattr(tf_cpu_init, 'CGROUP_V1_CPU_PERIOD', str(period))
+
+    # No cgroup files: no limit
+    assert tf_cpu_init._cgroup_cpu_limit() is None
+
+    # cgroup v1: -1 means unlimited, 150000/100000 rounds up to 2 CPUs
+    quota.write_text("-1\n")
+    period.write_text("100000\n")
+    assert tf_cpu_init._cgroup_cpu_limit() is None
+    quota.write_text("150000\n")
+    assert tf_cpu_init._cgroup_cpu_limit() == 2
+
+    # cgroup v2 takes precedence
+    cpu_max.write_text("max 100000\n")
+    assert tf_cpu_init._cgroup_cpu_limit() is None
+    cpu_max.write_text("50000 100000\n")
+    assert tf_cpu_init._cgroup_cpu_limit() == 1
+
+    monkeypatch.setattr(tf_cpu_init, '_cgroup_cpu_limit', lambda: 1)
+    assert tf_cpu_init.available_cpus() == 1